@@ -0,0 +1,17 @@
+"""
+Numba Compatibility Shim
+Exposes njit/prange whether or not numba is installed; without numba the
+decorated functions run as plain Python
+"""
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (bare or with arguments)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
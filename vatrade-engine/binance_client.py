@@ -1,205 +1,444 @@
 import asyncio
+import hmac
+import hashlib
+import time
 import httpx
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
-from typing import Dict, Optional
+from urllib.parse import urlencode
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 from config import settings
+from ticker_cache import cached, coalesce, interval_seconds
 
 logger = logging.getLogger(__name__)
 
+BINANCE_TESTNET_API_URL = "https://testnet.binance.vision"
+
+# Cache TTLs (seconds); klines are cached for a quarter of their interval,
+# but never past the close of the candle still forming
+TICKER_CACHE_TTL = 0.25
+BALANCE_CACHE_TTL = 2.0
+ACCOUNT_CACHE_TTL = 0.5
+
+# Credentials whose connection was verified recently skip the startup ping
+CREDENTIAL_CACHE_TTL = 3600
+
+# Pooled REST clients for API endpoints are closed after this much idle time
+CLIENT_IDLE_TTL = 600
+
+# (credential_id, api_key) -> (verified_at on the monotonic clock, open clients)
+_cred_cache: Dict[Tuple[Any, str], Tuple[float, int]] = {}
+
+# One keep-alive pool for all Binance REST traffic, shared by every bot and
+# credential in this process (API keys are sent per request)
+_http_session: Optional[httpx.AsyncClient] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_session(loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+    """Get or lazily create the shared HTTP session for an event loop"""
+    global _http_session, _http_session_loop
+
+    if _http_session is None or _http_session.is_closed or _http_session_loop is not loop:
+        _http_session = httpx.AsyncClient(
+            base_url=BINANCE_TESTNET_API_URL if settings.binance_testnet else settings.binance_api_url,
+            limits=httpx.Limits(
+                max_connections=settings.http_pool,
+                max_keepalive_connections=settings.http_pool,
+                keepalive_expiry=90
+            ),
+            http2=True,
+            timeout=10.0
+        )
+        _http_session_loop = loop
+
+    return _http_session
+
+
+async def close_http_session():
+    """Close the shared HTTP session (application shutdown)"""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.aclose()
+        _http_session = None
+
+
+def _prune_cred_cache(now: float):
+    """Drop expired verifications no open client refers to any more"""
+    expired = [
+        key for key, (verified_at, refs) in _cred_cache.items()
+        if refs == 0 and now - verified_at >= CREDENTIAL_CACHE_TTL
+    ]
+    for key in expired:
+        del _cred_cache[key]
+
+
+def _klines_ttl(klines: list, max_ttl: float) -> float:
+    """Cache klines until the last (forming) candle closes, at most max_ttl"""
+    if not klines:
+        return 0.0
+    # Row index 6 is the candle close time in milliseconds
+    return min(max_ttl, klines[-1][6] / 1000 - time.time())
+
+
+class BinanceAPIException(Exception):
+    """Error response returned by the Binance REST API"""
+
+    def __init__(self, status_code: int, code: Optional[int], message: str):
+        self.status_code = status_code
+        self.code = code
+        self.message = message
+        super().__init__(f"APIError(code={code}): {message}")
+
 
 class BinanceClient:
-    """Wrapper for Binance API client with credential management"""
-    
+    """Async Binance REST API client with credential management"""
+
     def __init__(self, user_id: int, credential_id: int, api_key: str, secret_key: str):
         self.user_id = user_id
         self.credential_id = credential_id
         self.api_key = api_key
         self.api_secret = secret_key
-        self.client: Optional[Client] = None
-    
+        self._headers = {'X-MBX-APIKEY': api_key}
+        self._http: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._clean_cache: Dict[str, str] = {}  # BTC/USDT -> BTCUSDT
+        self._account_cache: Optional[Tuple[float, Dict]] = None
+        self._cred_held = False  # Holds a reference on the _cred_cache entry
+
+        # Scope for private cache keys: a result is only shared with callers
+        # holding the same credentials, and never survives a key rotation
+        self._cache_scope = (
+            user_id, credential_id,
+            hashlib.sha256(f"{api_key}:{secret_key}".encode('utf-8')).hexdigest()
+        )
+
     async def initialize(self):
         """Initialize Binance client with provided credentials"""
         try:
             # Credentials sudah diterima dari backend via constructor
-            
-            # Initialize Binance client
-            # Testnet mode bisa diubah via environment variable
-            self.client = Client(
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-                testnet=settings.binance_testnet  # False = Production, True = Testnet
-            )
-            
-            # Test connection
-            await self._test_connection()
-            
+
+            # Testnet mode bisa diubah via environment variable (BINANCE_TESTNET)
+            self._loop = asyncio.get_running_loop()
+            self._http = _get_http_session(self._loop)
+
+            # Reuse a recent verification while the shared session is alive,
+            # otherwise test connection and cache the result
+            cred_key = (self.credential_id, self.api_key)
+            now = time.monotonic()
+            _prune_cred_cache(now)
+            entry = _cred_cache.get(cred_key)
+
+            if entry is not None and now - entry[0] < CREDENTIAL_CACHE_TTL and not self._http.is_closed:
+                verified_at, refs = entry
+                logger.info(f"Reusing warm Binance client for user {self.user_id}")
+            else:
+                await self._test_connection()
+                verified_at, refs = now, entry[1] if entry else 0
+
+            _cred_cache[cred_key] = (verified_at, refs + 1)
+            self._cred_held = True
+
             logger.info(f"Binance client initialized for user {self.user_id}")
-            
+
         except Exception as e:
+            self._http = None
             logger.error(f"Failed to initialize Binance client: {str(e)}")
             raise
-    
+
+    def _generate_signature(self, query_string: str) -> str:
+        """Generate HMAC SHA256 signature for request"""
+        return hmac.new(
+            self.api_secret.encode('utf-8'),
+            query_string.encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+
+    def _clean_symbol(self, symbol: str) -> str:
+        """Normalize symbol to Binance format, cached per client"""
+        clean = self._clean_cache.get(symbol)
+        if clean is None:
+            clean = self._clean_cache[symbol] = symbol.replace('/', '')
+        return clean
+
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                       signed: bool = False) -> Any:
+        """Send REST request and decode the JSON response"""
+        params = dict(params) if params else {}
+
+        if signed:
+            params['timestamp'] = int(time.time() * 1000)
+
+        # Signature must cover the exact query string that is sent
+        query_string = urlencode(params)
+        if signed:
+            query_string += f"&signature={self._generate_signature(query_string)}"
+
+        url = f"{path}?{query_string}" if query_string else path
+        response = await self._http.request(method, url, headers=self._headers)
+
+        if response.status_code >= 400:
+            try:
+                error = response.json()
+            except ValueError:
+                error = {}
+            raise BinanceAPIException(
+                response.status_code,
+                error.get('code'),
+                error.get('msg', response.text)
+            )
+
+        return response.json()
+
     async def _test_connection(self):
         """Test API connection"""
         try:
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.client.ping)
+            await coalesce(('ping',), lambda: self._request('GET', '/api/v3/ping'))
             logger.info("Binance API connection successful")
         except BinanceAPIException as e:
             logger.error(f"Binance API connection failed: {str(e)}")
             raise
-    
+
     async def get_ticker(self, symbol: str) -> Dict:
         """Get current ticker price"""
         try:
-            loop = asyncio.get_event_loop()
-            ticker = await loop.run_in_executor(
-                None, 
-                self.client.get_symbol_ticker,
-                symbol.replace('/', '')  # BTC/USDT -> BTCUSDT
+            symbol_clean = self._clean_symbol(symbol)
+            return await cached(
+                ('ticker', symbol_clean),
+                lambda: self._request('GET', '/api/v3/ticker/price', {'symbol': symbol_clean}),
+                TICKER_CACHE_TTL
             )
-            return ticker
         except Exception as e:
             logger.error(f"Failed to get ticker for {symbol}: {str(e)}")
             raise
-    
+
     async def get_klines(self, symbol: str, interval: str, limit: int = 100) -> list:
         """
         Get candlestick data
-        
+
         interval: 1m, 5m, 15m, 1h, 4h, 1d, etc.
         """
         try:
-            loop = asyncio.get_event_loop()
-            klines = await loop.run_in_executor(
-                None,
-                self.client.get_klines,
-                symbol.replace('/', ''),
-                interval,
-                limit
+            params = {'symbol': self._clean_symbol(symbol), 'interval': interval, 'limit': limit}
+            max_ttl = interval_seconds(interval) / 4
+            return await cached(
+                ('klines', params['symbol'], interval, limit),
+                lambda: self._request('GET', '/api/v3/klines', params),
+                lambda klines: _klines_ttl(klines, max_ttl)
             )
-            return klines
         except Exception as e:
             logger.error(f"Failed to get klines for {symbol}: {str(e)}")
             raise
-    
+
     async def get_account_info(self) -> Dict:
         """Get full account information"""
         try:
-            loop = asyncio.get_event_loop()
-            account = await loop.run_in_executor(None, self.client.get_account)
-            return account
+            return await self._account()
         except Exception as e:
             logger.error(f"Failed to get account info: {str(e)}")
             raise
-    
+
+    async def _account(self) -> Dict:
+        """Get account data, shared by account info and balance lookups"""
+        if self._account_cache is not None:
+            fetched_at, account = self._account_cache
+            if time.monotonic() - fetched_at < ACCOUNT_CACHE_TTL:
+                return account
+
+        account = await coalesce(
+            ('account', self._cache_scope),
+            lambda: self._request('GET', '/api/v3/account', signed=True)
+        )
+        self._account_cache = (time.monotonic(), account)
+        return account
+
     async def get_account_balance(self) -> Dict:
         """Get account balance (simplified, only non-zero)"""
         try:
-            loop = asyncio.get_event_loop()
-            account = await loop.run_in_executor(None, self.client.get_account)
-            
-            # Parse balances
-            balances = {}
-            for balance in account['balances']:
-                free = float(balance['free'])
-                locked = float(balance['locked'])
-                if free > 0 or locked > 0:
-                    balances[balance['asset']] = {
-                        'free': free,
-                        'locked': locked,
-                        'total': free + locked
-                    }
-            
-            return balances
+            # Private data, so the key is scoped to this user's credentials
+            return await cached(
+                ('balance', self._cache_scope),
+                self._fetch_account_balance,
+                BALANCE_CACHE_TTL
+            )
         except Exception as e:
             logger.error(f"Failed to get account balance: {str(e)}")
             raise
-    
-    async def place_order(self, symbol: str, side: str, amount: float, 
+
+    async def _fetch_account_balance(self) -> Dict:
+        """Fetch account and parse non-zero balances"""
+        account = await self._account()
+
+        # Parse balances
+        balances = {}
+        for balance in account['balances']:
+            free = float(balance['free'])
+            locked = float(balance['locked'])
+            if free > 0 or locked > 0:
+                balances[balance['asset']] = {
+                    'free': free,
+                    'locked': locked,
+                    'total': free + locked
+                }
+
+        return balances
+
+    async def place_order(self, symbol: str, side: str, amount: float,
                          price: Optional[float] = None) -> Dict:
         """
         Place an order
-        
+
         side: BUY or SELL
         amount: quantity to trade
         price: limit price (None for market order)
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            symbol_clean = symbol.replace('/', '')  # BTC/USDT -> BTCUSDT
-            
+            params = {
+                'symbol': self._clean_symbol(symbol),
+                'side': side
+            }
+
             if price:
                 # Limit order
-                order = await loop.run_in_executor(
-                    None,
-                    self.client.create_order,
-                    symbol_clean,
-                    side,
-                    'LIMIT',
-                    'GTC',  # Good till cancelled
-                    amount,
-                    str(price)
-                )
+                params['type'] = 'LIMIT'
+                params['timeInForce'] = 'GTC'  # Good till cancelled
+                params['quantity'] = amount
+                params['price'] = str(price)
             else:
                 # Market order
-                order = await loop.run_in_executor(
-                    None,
-                    self.client.create_order,
-                    symbol_clean,
-                    side,
-                    'MARKET',
-                    None,
-                    amount
-                )
-            
+                params['type'] = 'MARKET'
+                params['quantity'] = amount
+
+            order = await self._request('POST', '/api/v3/order', params, signed=True)
+
             logger.info(f"Order placed: {order['orderId']} - {side} {amount} {symbol}")
             return order
-            
+
         except BinanceAPIException as e:
             logger.error(f"Binance API error placing order: {str(e)}")
             raise
         except Exception as e:
             logger.error(f"Failed to place order: {str(e)}")
             raise
-    
+
     async def get_order_status(self, symbol: str, order_id: int) -> Dict:
         """Get order status"""
         try:
-            loop = asyncio.get_event_loop()
-            order = await loop.run_in_executor(
-                None,
-                self.client.get_order,
-                symbol.replace('/', ''),
-                order_id
+            params = {'symbol': self._clean_symbol(symbol), 'orderId': order_id}
+            return await coalesce(
+                ('order', self._cache_scope, params['symbol'], order_id),
+                lambda: self._request('GET', '/api/v3/order', params, signed=True)
             )
-            return order
         except Exception as e:
             logger.error(f"Failed to get order status: {str(e)}")
             raise
-    
+
     async def cancel_order(self, symbol: str, order_id: int) -> Dict:
         """Cancel an order"""
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self.client.cancel_order,
-                symbol.replace('/', ''),
-                order_id
+            result = await self._request(
+                'DELETE', '/api/v3/order',
+                {'symbol': self._clean_symbol(symbol), 'orderId': order_id},
+                signed=True
             )
             logger.info(f"Order cancelled: {order_id}")
             return result
         except Exception as e:
             logger.error(f"Failed to cancel order: {str(e)}")
             raise
-    
+
     async def close(self):
         """Cleanup resources"""
-        # python-binance doesn't require explicit cleanup
+        if self._http is None:
+            return
+
+        # Shared HTTP session stays open for the other bots; the credential
+        # stays warm until its TTL expires
+        self._http = None
+        self.release_credential()
+
         logger.info(f"Binance client closed for user {self.user_id}")
+
+    def release_credential(self):
+        """
+        Drop this client's reference on its credential verification
+
+        Leaves the client usable, so requests still in flight on it finish.
+        """
+        if not self._cred_held:
+            return
+        self._cred_held = False
+
+        cred_key = (self.credential_id, self.api_key)
+        entry = _cred_cache.get(cred_key)
+        if entry is not None:
+            verified_at, refs = entry
+            if refs <= 1 and time.monotonic() - verified_at >= CREDENTIAL_CACHE_TTL:
+                del _cred_cache[cred_key]
+            else:
+                _cred_cache[cred_key] = (verified_at, max(refs - 1, 0))
+
+
+class BinanceClientPool:
+    """Reuse initialized REST clients across API requests, per user credential"""
+
+    def __init__(self, idle_ttl: float = CLIENT_IDLE_TTL):
+        self.idle_ttl = idle_ttl
+        # (user_id, credential_id) -> (client, last used on the monotonic clock)
+        self.clients: Dict[Tuple[Any, Any], Tuple[BinanceClient, float]] = {}
+
+    async def get_client(self, user_id, credential_id, api_key: str, secret_key: str) -> BinanceClient:
+        """Get a pooled client or create and initialize a new one"""
+        await self._evict_idle()
+
+        client_key = (user_id, credential_id)
+        entry = self.clients.get(client_key)
+
+        if entry is not None and entry[0].api_key == api_key and entry[0].api_secret == secret_key:
+            client = entry[0]
+        else:
+            # Concurrent first requests for a credential share one initialize()
+            client = await coalesce(
+                ('client', client_key, api_key),
+                lambda: self._create_client(user_id, credential_id, api_key, secret_key)
+            )
+
+        self.clients[client_key] = (client, time.monotonic())
+        return client
+
+    async def _create_client(self, user_id, credential_id, api_key: str, secret_key: str) -> BinanceClient:
+        """Initialize a client and replace any stale one for the same credential"""
+        client = BinanceClient(user_id, credential_id, api_key, secret_key)
+        await client.initialize()
+
+        client_key = (user_id, credential_id)
+        stale = self.clients.pop(client_key, None)
+        self.clients[client_key] = (client, time.monotonic())
+
+        # Requests may still be running on the replaced client, so release
+        # it rather than close it (the shared HTTP session stays open anyway)
+        if stale is not None:
+            stale[0].release_credential()
+
+        return client
+
+    async def _evict_idle(self):
+        """Close clients that have not been used within the idle TTL"""
+        cutoff = time.monotonic() - self.idle_ttl
+        expired = [key for key, (_, last_used) in self.clients.items() if last_used < cutoff]
+
+        for key in expired:
+            client, _ = self.clients.pop(key)
+            await client.close()
+
+    async def close_all(self):
+        """Close all pooled clients"""
+        clients = [client for client, _ in self.clients.values()]
+        self.clients.clear()
+
+        for client in clients:
+            await client.close()
+
+
+# Global instance
+client_pool = BinanceClientPool()
@@ -1,13 +1,15 @@
 import asyncio
-import json
 import hmac
 import hashlib
+import itertools
 import time
-import uuid
+import orjson
 import websockets
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 import logging
 
+from config import settings
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,10 @@ class BinanceWebSocketAPI:
         self.api_key = api_key
         self.api_secret = api_secret
         
+        # Keyed HMAC state is built once and copied for each signature
+        self._secret_bytes = api_secret.encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, b'', hashlib.sha256)
+        
         # WebSocket endpoints
         if testnet:
             self.ws_url = "wss://testnet.binance.vision/ws-api/v3"
@@ -28,28 +34,39 @@ class BinanceWebSocketAPI:
             self.ws_url = "wss://ws-api.binance.com:443/ws-api/v3"
         
         self.websocket: Optional[websockets.WebSocketClientProtocol] = None
-        self.pending_requests: Dict[str, asyncio.Future] = {}
+        self.pending_requests: Dict[int, asyncio.Future] = {}
         self.is_connected = False
         self._receive_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._id_counter = itertools.count(1)  # Unique per connection
+        
+        # Bounded buffer between the receive loop and response dispatch
+        self._inbound: asyncio.Queue = asyncio.Queue(maxsize=settings.ws_buffer)
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self.dropped_messages = 0
+        
+        # (method, symbol) -> (query string template, JSON payload template)
+        # for hot single-order calls; only id/orderId/timestamp/signature vary
+        self._templates: Dict[Tuple[str, str], Tuple[str, str]] = {}
     
     def _generate_signature(self, params: Dict[str, Any]) -> str:
         """Generate HMAC SHA256 signature for request"""
         query_string = '&'.join([f"{key}={value}" for key, value in sorted(params.items())])
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        h = self._hmac_template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
     
     async def connect(self):
         """Connect to Binance WebSocket API"""
         try:
             self.websocket = await websockets.connect(self.ws_url)
             self.is_connected = True
+            self._loop = asyncio.get_running_loop()
             
-            # Start receiving messages
+            # Start receiving and dispatching messages
             self._receive_task = asyncio.create_task(self._receive_messages())
+            if self._dispatch_task is None or self._dispatch_task.done():
+                self._dispatch_task = asyncio.create_task(self._dispatch_messages())
             
             logger.info(f"Connected to Binance WebSocket API: {self.ws_url}")
         except Exception as e:
@@ -60,15 +77,22 @@ class BinanceWebSocketAPI:
         """Receive and process messages from WebSocket"""
         try:
             while self.is_connected and self.websocket:
-                message = await self.websocket.recv()
-                data = json.loads(message)
+                batch = [await self.websocket.recv()]
                 
-                # Match response with pending request
-                request_id = data.get('id')
-                if request_id and request_id in self.pending_requests:
-                    future = self.pending_requests.pop(request_id)
-                    if not future.done():
-                        future.set_result(data)
+                # Slurp every frame already buffered before yielding again;
+                # recv() returns without suspending while the queue is non-empty
+                while self.websocket.messages:
+                    batch.append(await self.websocket.recv())
+                
+                for message in batch:
+                    try:
+                        self._inbound.put_nowait(orjson.loads(message))
+                    except asyncio.QueueFull:
+                        self.dropped_messages += 1
+                        logger.warning(
+                            f"WebSocket inbound buffer full, dropped message "
+                            f"(total dropped: {self.dropped_messages})"
+                        )
                 
         except websockets.exceptions.ConnectionClosed:
             logger.info("WebSocket connection closed")
@@ -77,13 +101,30 @@ class BinanceWebSocketAPI:
             logger.error(f"Error receiving messages: {str(e)}")
             self.is_connected = False
     
+    async def _dispatch_messages(self):
+        """Resolve pending requests from the inbound buffer"""
+        while True:
+            batch = [await self._inbound.get()]
+            
+            # Take everything already buffered, then wake the waiters
+            while not self._inbound.empty():
+                batch.append(self._inbound.get_nowait())
+            
+            for data in batch:
+                # Match response with pending request
+                request_id = data.get('id')
+                if request_id and request_id in self.pending_requests:
+                    future = self.pending_requests.pop(request_id)
+                    if not future.done():
+                        future.set_result(data)
+    
     async def _send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Send request and wait for response"""
         if not self.is_connected or not self.websocket:
             await self.connect()
         
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        # Generate unique request ID (Binance accepts integer IDs)
+        request_id = next(self._id_counter)
         
         # Prepare params with signature
         if params is None:
@@ -102,12 +143,55 @@ class BinanceWebSocketAPI:
             "params": params
         }
         
+        # Send request (decoded so it still goes out as a text frame)
+        return await self._send_and_wait(request_id, orjson.dumps(request).decode())
+    
+    def _get_template(self, method: str, symbol: str) -> Tuple[str, str]:
+        """Build (once) the signing and payload templates for a single-order call"""
+        key = (method, symbol)
+        template = self._templates.get(key)
+        
+        if template is None:
+            # Escape literal '%' so only our placeholders are substituted
+            api_key = self.api_key.replace('%', '%%')
+            symbol_q = symbol.replace('%', '%%')
+            
+            # Query string keys must stay sorted, as in _generate_signature
+            query_template = f"apiKey={api_key}&orderId=%d&symbol={symbol_q}&timestamp=%d"
+            payload_template = (
+                '{"id":%d,"method":' + orjson.dumps(method).decode() +
+                ',"params":{"symbol":' + orjson.dumps(symbol).decode().replace('%', '%%') +
+                ',"orderId":%d,"apiKey":' + orjson.dumps(self.api_key).decode().replace('%', '%%') +
+                ',"timestamp":%d,"signature":"%s"}}'
+            )
+            template = self._templates[key] = (query_template, payload_template)
+        
+        return template
+    
+    async def _send_request_fast(self, method: str, symbol: str, order_id: int) -> Dict[str, Any]:
+        """Send a (symbol, orderId) request by filling in a pre-built payload"""
+        if not self.is_connected or not self.websocket:
+            await self.connect()
+        
+        query_template, payload_template = self._get_template(method, symbol)
+        
+        request_id = next(self._id_counter)
+        order_id = int(order_id)
+        timestamp = int(time.time() * 1000)
+        
+        h = self._hmac_template.copy()
+        h.update((query_template % (order_id, timestamp)).encode('utf-8'))
+        
+        payload = payload_template % (request_id, order_id, timestamp, h.hexdigest())
+        return await self._send_and_wait(request_id, payload)
+    
+    async def _send_and_wait(self, request_id: int, payload: str) -> Dict[str, Any]:
+        """Send an encoded request and wait for its response"""
         # Create future for response
-        future = asyncio.Future()
+        future = self._loop.create_future()
         self.pending_requests[request_id] = future
         
-        # Send request
-        await self.websocket.send(json.dumps(request))
+        await self.websocket.send(payload)
         
         # Wait for response with timeout
         try:
@@ -227,12 +311,7 @@ class BinanceWebSocketAPI:
         Returns:
             Canceled order information
         """
-        params = {
-            'symbol': symbol,
-            'orderId': order_id
-        }
-        
-        response = await self._send_request('order.cancel', params)
+        response = await self._send_request_fast('order.cancel', symbol, order_id)
         return response.get('result', {})
     
     async def get_order_status(self, symbol: str, order_id: int) -> Dict[str, Any]:
@@ -240,24 +319,20 @@ class BinanceWebSocketAPI:
         Query single order status
         Method: order.status
         """
-        params = {
-            'symbol': symbol,
-            'orderId': order_id
-        }
-        
-        response = await self._send_request('order.status', params)
+        response = await self._send_request_fast('order.status', symbol, order_id)
         return response.get('result', {})
     
     async def close(self):
         """Close WebSocket connection"""
         self.is_connected = False
         
-        if self._receive_task:
-            self._receive_task.cancel()
-            try:
-                await self._receive_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._receive_task, self._dispatch_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         
         if self.websocket:
             await self.websocket.close()
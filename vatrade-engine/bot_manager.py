@@ -1,12 +1,15 @@
 import asyncio
+import os
+import time
 import uuid
 import httpx
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 
 from binance_client import BinanceClient
-from strategy import StrategyFactory
+from strategy import CPUHeavyStrategy, StrategyFactory
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -15,6 +18,14 @@ logger = logging.getLogger(__name__)
 class BotInstance:
     """Represents a running bot instance"""
     
+    __slots__ = (
+        'bot_id', 'user_id', 'credential_id', 'strategy_name', 'symbol',
+        'symbol_clean', 'trade_amount', 'status', 'created_at', 'created_ns',
+        'last_update_ns', 'total_trades', 'successful_trades', 'failed_trades',
+        'total_profit', 'client', 'strategy', 'task', 'running',
+        '_cached_dict', '_cached_at'
+    )
+    
     def __init__(self, bot_id: str, user_id: int, credential_id: int, 
                  strategy: str, symbol: str, trade_amount: float):
         self.bot_id = bot_id
@@ -22,10 +33,14 @@ class BotInstance:
         self.credential_id = credential_id
         self.strategy_name = strategy
         self.symbol = symbol
+        self.symbol_clean = symbol.replace('/', '')  # BTC/USDT -> BTCUSDT
         self.trade_amount = trade_amount
         self.status = "initializing"
         self.created_at = datetime.utcnow()
-        self.last_update = datetime.utcnow()
+        
+        # Heartbeat is a monotonic clock reading; converted to wall time on read
+        self.created_ns = time.monotonic_ns()
+        self.last_update_ns = self.created_ns
         
         # Trading state
         self.total_trades = 0
@@ -38,10 +53,26 @@ class BotInstance:
         self.strategy = None
         self.task: Optional[asyncio.Task] = None
         self.running = False
+        
+        # Cached API representation, rebuilt only when the bot state changes
+        self._cached_dict: Optional[Dict] = None
+        self._cached_at = None
+    
+    @property
+    def last_update(self) -> datetime:
+        """Wall-clock time of the last heartbeat"""
+        return self.created_at + timedelta(
+            microseconds=(self.last_update_ns - self.created_ns) // 1000
+        )
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for API response"""
-        return {
+        # Every state change moves last_update, status or failed_trades
+        cache_key = (self.last_update_ns, self.status, self.failed_trades)
+        if self._cached_dict is not None and self._cached_at == cache_key:
+            return self._cached_dict
+        
+        self._cached_dict = {
             "bot_id": self.bot_id,
             "user_id": self.user_id,
             "credential_id": self.credential_id,
@@ -58,6 +89,8 @@ class BotInstance:
                 "total_profit": self.total_profit
             }
         }
+        self._cached_at = cache_key
+        return self._cached_dict
 
 
 class BotManager:
@@ -65,7 +98,14 @@ class BotManager:
     
     def __init__(self):
         self.bots: Dict[str, BotInstance] = {}
-        self.user_bots: Dict[int, List[str]] = {}  # user_id -> [bot_ids]
+        self.user_bots: Dict[int, Dict[str, None]] = {}  # user_id -> {bot_id: None}, in start order
+        
+        # Shared pool for CPU-heavy strategy analysis (threads, not processes,
+        # to keep memory flat per bot)
+        self._cpu_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count(),
+            thread_name_prefix='strategy'
+        )
     
     async def start_bot(self, user_id: int, credential_id: int, api_key: str,
                        secret_key: str, strategy: str, symbol: str, 
@@ -101,8 +141,8 @@ class BotManager:
             # Register bot
             self.bots[bot_id] = bot
             if user_id not in self.user_bots:
-                self.user_bots[user_id] = []
-            self.user_bots[user_id].append(bot_id)
+                self.user_bots[user_id] = {}
+            self.user_bots[user_id][bot_id] = None
             
             logger.info(f"Bot {bot_id} started successfully for user {user_id}")
             return bot_id
@@ -115,12 +155,19 @@ class BotManager:
     async def _run_bot(self, bot: BotInstance):
         """Main bot loop"""
         logger.info(f"Bot {bot.bot_id} loop started")
+        loop = asyncio.get_running_loop()
         
         try:
             while bot.running:
                 try:
                     # Execute strategy
-                    signal = await bot.strategy.analyze()
+                    if isinstance(bot.strategy, CPUHeavyStrategy) and bot.strategy.is_cpu_heavy():
+                        market_data = await bot.strategy.fetch_market_data()
+                        signal = await loop.run_in_executor(
+                            self._cpu_pool, bot.strategy.analyze_sync, market_data
+                        )
+                    else:
+                        signal = await bot.strategy.analyze()
                     
                     if signal:
                         # Execute trade based on signal
@@ -135,7 +182,7 @@ class BotManager:
                         bot.total_trades += 1
                     
                     # Update timestamp
-                    bot.last_update = datetime.utcnow()
+                    bot.last_update_ns = time.monotonic_ns()
                     
                     # Wait before next iteration (adjust based on strategy)
                     await asyncio.sleep(bot.strategy.get_interval())
@@ -158,12 +205,13 @@ class BotManager:
         """Execute a trade based on signal"""
         try:
             order_type = signal.get('type')  # 'buy' or 'sell'
+            side = order_type.upper()
             price = signal.get('price')
             amount = signal.get('amount', bot.trade_amount)
             
             logger.info(
                 f"🔔 Bot {bot.bot_id} SIGNAL DETECTED: "
-                f"{order_type.upper()} {bot.symbol} at {price:.2f} USDT, "
+                f"{side} {bot.symbol} at {price:.2f} USDT, "
                 f"Amount: {amount:.6f}"
             )
             
@@ -171,8 +219,8 @@ class BotManager:
             # If price is None → Market order
             # If price is set → Limit order
             order = await bot.client.place_order(
-                symbol=bot.symbol,
-                side=order_type.upper(),
+                symbol=bot.symbol_clean,
+                side=side,
                 amount=amount,
                 price=price  # None for market, price for limit
             )
@@ -266,7 +314,7 @@ class BotManager:
         
         # Remove from registry
         if user_id in self.user_bots:
-            self.user_bots[user_id].remove(bot_id)
+            self.user_bots[user_id].pop(bot_id, None)
         
         logger.info(f"Bot {bot_id} stopped")
         return True
@@ -286,7 +334,7 @@ class BotManager:
     
     async def get_all_user_bots(self, user_id: int) -> Dict:
         """Get all bots for a user"""
-        user_bot_ids = self.user_bots.get(user_id, [])
+        user_bot_ids = self.user_bots.get(user_id, ())
         bots_data = []
         
         for bot_id in user_bot_ids:
@@ -1,3 +1,4 @@
+from dataclasses import make_dataclass
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -27,10 +28,24 @@ class Settings(BaseSettings):
     default_trade_amount: float = 10.0
     max_concurrent_bots: int = 10
     
+    # Concurrency (per worker process)
+    thread_pool_size: int = 128
+    http_pool: int = 200
+    ws_buffer: int = 1024
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
+# Plain immutable snapshot of the parsed settings, so hot-path reads are
+# slot loads instead of pydantic model attribute access
+FrozenSettings = make_dataclass(
+    'FrozenSettings',
+    [(name, field.annotation) for name, field in Settings.model_fields.items()],
+    frozen=True,
+    slots=True
+)
+
 # Global settings instance
-settings = Settings()
+settings = FrozenSettings(**Settings().model_dump())
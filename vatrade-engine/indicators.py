@@ -3,14 +3,90 @@ Technical Indicators Module
 Provides calculation functions for EMA, RSI, and other trading indicators
 """
 import numpy as np
-from typing import List, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+from typing import List, Optional, Sequence, Tuple, Union
+
+from _njit import NUMBA_AVAILABLE
+
+# Optional JIT kernels; the SciPy/NumPy paths below are the fallback
+if NUMBA_AVAILABLE:
+    from indicators_numba import (
+        EMA_SPECIAL_NB, ema_last_nb, ema_series_nb, indicators_last_nb, rsi_last_nb,
+        update_all_ema_nb
+    )
+else:
+    EMA_SPECIAL_NB = {}
+    ema_last_nb = ema_series_nb = indicators_last_nb = rsi_last_nb = update_all_ema_nb = None
+
+# Below this many EMAs, thread start-up costs more than the parallel update saves
+PARALLEL_UPDATE_MIN_SIZE = 4096
+
+# Price histories may be passed as float64 arrays or plain sequences
+PriceArray = Union[np.ndarray, Sequence[float]]
+
+
+def _as_array(prices: PriceArray) -> np.ndarray:
+    """Return prices as a float64 array, without copying existing arrays"""
+    if isinstance(prices, np.ndarray) and prices.dtype == np.float64:
+        return prices
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _ema(arr: np.ndarray, period: int) -> float:
+    """Final EMA of a float64 array; caller guarantees arr.size >= period"""
+    if ema_last_nb is not None:
+        special = EMA_SPECIAL_NB.get(period)
+        if special is not None:
+            return float(special(arr))
+        return float(ema_last_nb(arr, period))
+    
+    # Calculate multiplier
+    multiplier = 2.0 / (period + 1)
+    one_minus = 1.0 - multiplier
+    
+    # Initialize with SMA (Simple Moving Average)
+    sma = arr[:period].mean()
+    
+    if arr.size == period:
+        return float(sma)
+    
+    # EMA recurrence as a first-order IIR filter, seeded with the SMA:
+    # y[n] = multiplier * x[n] + (1 - multiplier) * y[n-1]
+    ema, _ = lfilter([multiplier], [1.0, -one_minus], arr[period:], zi=[one_minus * sma])
+    
+    return float(ema[-1])
+
+
+def _rsi_averages(arr: np.ndarray, period: int) -> Tuple[float, float]:
+    """Wilder (avg_gain, avg_loss) of a float64 array; caller guarantees arr.size > period"""
+    # Calculate price deltas
+    deltas = np.diff(arr)
+    
+    # Separate gains and losses (branchless, vectorized max)
+    gains = np.maximum(deltas, 0.0)
+    losses = np.maximum(-deltas, 0.0)
+    
+    # Calculate first average (simple average)
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+    
+    # Wilder smoothing for remaining periods as an IIR filter:
+    # avg[n] = gain[n] / period + avg[n-1] * (period - 1) / period
+    if gains.size > period:
+        decay = (period - 1) / period
+        b, a = [1.0 / period], [1.0, -decay]
+        avg_gain = lfilter(b, a, gains[period:], zi=[decay * avg_gain])[0][-1]
+        avg_loss = lfilter(b, a, losses[period:], zi=[decay * avg_loss])[0][-1]
+    
+    return float(avg_gain), float(avg_loss)
 
 
 class TechnicalIndicators:
     """Technical indicators calculator for trading strategies"""
     
     @staticmethod
-    def calculate_ema(prices: List[float], period: int) -> Optional[float]:
+    def calculate_ema(prices: PriceArray, period: int) -> Optional[float]:
         """
         Calculate Exponential Moving Average (EMA)
         
@@ -20,7 +96,7 @@ class TechnicalIndicators:
         - First EMA uses SMA as seed
         
         Args:
-            prices: List of prices (closing prices)
+            prices: Array or list of prices (closing prices)
             period: EMA period (e.g., 20, 50)
             
         Returns:
@@ -29,44 +105,117 @@ class TechnicalIndicators:
         if len(prices) < period:
             return None
         
-        # Calculate multiplier
-        multiplier = 2 / (period + 1)
+        arr = _as_array(prices)
         
-        # Initialize with SMA (Simple Moving Average)
-        sma = sum(prices[:period]) / period
-        ema = sma
+        return _ema(arr, period)
+    
+    @staticmethod
+    def calculate_ema_batch(prices_2d: np.ndarray, period: int) -> np.ndarray:
+        """
+        Calculate the current EMA for many price histories at once
         
-        # Calculate EMA for each subsequent price
-        for price in prices[period:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
+        Args:
+            prices_2d: 2-D array, one row of prices per series (e.g. per bot)
+            period: EMA period
+            
+        Returns:
+            1-D array of current EMA values, one per row (NaN if insufficient data)
+        """
+        arr = _as_array(prices_2d)
+        if arr.ndim != 2:
+            raise ValueError("prices_2d must be a 2-D array")
         
-        return ema
+        if arr.shape[1] < period:
+            return np.full(arr.shape[0], np.nan)
+        
+        multiplier = 2.0 / (period + 1)
+        one_minus = 1.0 - multiplier
+        
+        # Per-row SMA seeds, then the recurrence along each row in one call
+        sma = arr[:, :period].mean(axis=1)
+        
+        if arr.shape[1] == period:
+            return sma
+        
+        ema, _ = lfilter(
+            [multiplier], [1.0, -one_minus], arr[:, period:], axis=1,
+            zi=(one_minus * sma)[:, None]
+        )
+        
+        return ema[:, -1]
     
     @staticmethod
-    def calculate_ema_series(prices: List[float], period: int) -> List[Optional[float]]:
+    def calculate_ema_series(prices: PriceArray, period: int) -> np.ndarray:
         """
         Calculate EMA series for all prices
         
         Args:
-            prices: List of prices
+            prices: Array or list of prices
             period: EMA period
             
         Returns:
-            List of EMA values (None for insufficient data points)
+            Array of EMA values (NaN for insufficient data points);
+            use to_optional_list() for a list with None instead
+        """
+        arr = _as_array(prices)
+        
+        if arr.size < period:
+            return np.full(arr.size, np.nan)
+        
+        if ema_series_nb is not None:
+            return ema_series_nb(np.ascontiguousarray(arr), period)
+        
+        out = np.full(arr.size, np.nan)
+        multiplier = 2.0 / (period + 1)
+        one_minus = 1.0 - multiplier
+        
+        # Seed with the SMA at index period-1, then run the recurrence once
+        # over the remaining prices
+        sma = arr[:period].mean()
+        out[period - 1] = sma
+        out[period:], _ = lfilter([multiplier], [1.0, -one_minus], arr[period:], zi=[one_minus * sma])
+        
+        return out
+    
+    @staticmethod
+    def calculate_sma_series(prices: PriceArray, period: int) -> np.ndarray:
+        """
+        Calculate Simple Moving Average (SMA) series for all prices
+        
+        Args:
+            prices: Array or list of prices
+            period: SMA period
+            
+        Returns:
+            Array of SMA values (NaN for insufficient data points);
+            use to_optional_list() for a list with None instead
         """
-        ema_values = []
+        arr = _as_array(prices)
+        out = np.full(arr.size, np.nan)
+        
+        if arr.size < period:
+            return out
         
-        for i in range(len(prices)):
-            if i < period - 1:
-                ema_values.append(None)
-            else:
-                ema = TechnicalIndicators.calculate_ema(prices[:i+1], period)
-                ema_values.append(ema)
+        # Every window of `period` prices as a strided view, reduced at once
+        out[period - 1:] = sliding_window_view(arr, period).mean(axis=1)
         
-        return ema_values
+        return out
     
     @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
+    def to_optional_list(values: np.ndarray) -> List[Optional[float]]:
+        """
+        Convert an indicator series to a list, mapping NaN to None
+        
+        Args:
+            values: Indicator series from one of the *_series calculators
+            
+        Returns:
+            List of floats with None for insufficient data points
+        """
+        return [None if value != value else value for value in values.tolist()]
+    
+    @staticmethod
+    def calculate_rsi(prices: PriceArray, period: int = 14) -> Optional[float]:
         """
         Calculate Relative Strength Index (RSI)
         
@@ -78,7 +227,7 @@ class TechnicalIndicators:
         5. RSI = 100 - (100 / (1 + RS))
         
         Args:
-            prices: List of prices (closing prices)
+            prices: Array or list of prices (closing prices)
             period: RSI period (default: 14)
             
         Returns:
@@ -87,31 +236,164 @@ class TechnicalIndicators:
         if len(prices) < period + 1:
             return None
         
-        # Calculate price deltas
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
+        arr = _as_array(prices)
+        
+        if rsi_last_nb is not None:
+            return float(rsi_last_nb(arr, period))
         
-        # Separate gains and losses
-        gains = [delta if delta > 0 else 0 for delta in deltas]
-        losses = [-delta if delta < 0 else 0 for delta in deltas]
+        avg_gain, avg_loss = _rsi_averages(arr, period)
+        return TechnicalIndicators.rsi_from_averages(avg_gain, avg_loss)
+    
+    @staticmethod
+    def calculate_rsi_averages(prices: PriceArray, period: int = 14) -> Optional[Tuple[float, float]]:
+        """
+        Calculate Wilder-smoothed average gain and average loss
         
-        # Calculate first average (simple average)
-        avg_gain = sum(gains[:period]) / period
-        avg_loss = sum(losses[:period]) / period
+        Args:
+            prices: Array or list of prices (closing prices)
+            period: RSI period (default: 14)
+            
+        Returns:
+            (avg_gain, avg_loss) or None if insufficient data
+        """
+        if len(prices) < period + 1:
+            return None
+        
+        arr = _as_array(prices)
+        
+        return _rsi_averages(arr, period)
+    
+    @staticmethod
+    def compute_indicators(prices: PriceArray, ema_periods: Tuple[int, ...] = (20, 50),
+                           rsi_period: int = 14) -> Optional[Tuple[Tuple[float, ...], float, float]]:
+        """
+        Calculate several EMAs and the RSI averages over the same prices at once
         
-        # Calculate smoothed averages for remaining periods
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        With numba this is a single pass over the prices; otherwise it falls
+        back to the individual calculators.
         
+        Args:
+            prices: Array or list of prices (closing prices)
+            ema_periods: EMA periods (default: 20, 50)
+            rsi_period: RSI period (default: 14)
+            
+        Returns:
+            (ema values in ema_periods order, avg_gain, avg_loss) or None if
+            insufficient data; use rsi_from_averages() for the RSI
+        """
+        if len(prices) < max(max(ema_periods), rsi_period + 1):
+            return None
+        
+        arr = _as_array(prices)
+        
+        if indicators_last_nb is not None:
+            emas, avg_gain, avg_loss = indicators_last_nb(
+                arr, np.asarray(ema_periods, dtype=np.int64), rsi_period
+            )
+            return tuple(emas.tolist()), float(avg_gain), float(avg_loss)
+        
+        # Length was validated once above, so skip the public wrappers' checks
+        emas = tuple(_ema(arr, period) for period in ema_periods)
+        avg_gain, avg_loss = _rsi_averages(arr, rsi_period)
+        return emas, avg_gain, avg_loss
+    
+    @staticmethod
+    def rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
+        """
+        Calculate RSI from average gain and average loss
+        
+        Args:
+            avg_gain: Smoothed average gain
+            avg_loss: Smoothed average loss
+            
+        Returns:
+            RSI value
+        """
         # Avoid division by zero
         if avg_loss == 0:
             return 100
         
         # Calculate RS and RSI
         rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        return 100 - (100 / (1 + rs))
+    
+    @staticmethod
+    def update_ema(prev_ema: float, price: float, period: int) -> float:
+        """
+        Advance an EMA by one price (O(1) streaming update)
         
-        return rsi
+        Args:
+            prev_ema: EMA value before this price
+            price: New price
+            period: EMA period
+            
+        Returns:
+            New EMA value
+        """
+        multiplier = 2.0 / (period + 1)
+        one_minus = 1.0 - multiplier
+        return (price * multiplier) + (prev_ema * one_minus)
+    
+    @staticmethod
+    def update_ema_batch(states: np.ndarray, prices: PriceArray, multipliers: PriceArray) -> np.ndarray:
+        """
+        Advance many independent EMAs by one price each (O(1) per EMA), in place
+        
+        State is laid out as parallel arrays, one slot per series (e.g. per bot
+        and period); large batches run across cores when numba is installed.
+        
+        Args:
+            states: Writable 1-D float64 array of current EMA values, updated in place
+            prices: New price for each slot (or one price for all)
+            multipliers: 2 / (period + 1) for each slot (or one for all)
+            
+        Returns:
+            The updated states array
+            
+        Raises:
+            ValueError: If states is not a writable 1-D float64 array, or
+                prices/multipliers do not broadcast to its shape
+        """
+        if (not isinstance(states, np.ndarray) or states.dtype != np.float64 or
+                states.ndim != 1 or not states.flags.writeable):
+            raise ValueError("states must be a writable 1-D float64 array")
+        
+        # Both paths accept the same inputs; the kernel never reads past a slot
+        prices = np.broadcast_to(_as_array(prices), states.shape)
+        multipliers = np.broadcast_to(_as_array(multipliers), states.shape)
+        
+        if update_all_ema_nb is not None and states.size >= PARALLEL_UPDATE_MIN_SIZE:
+            update_all_ema_nb(states, prices, multipliers)
+        else:
+            states *= 1.0 - multipliers
+            states += prices * multipliers
+        
+        return states
+    
+    @staticmethod
+    def update_rsi(avg_gain: float, avg_loss: float, prev_price: float,
+                   price: float, period: int = 14) -> Tuple[float, float]:
+        """
+        Advance Wilder RSI averages by one price (O(1) streaming update)
+        
+        Args:
+            avg_gain: Average gain before this price
+            avg_loss: Average loss before this price
+            prev_price: Previous price
+            price: New price
+            period: RSI period (default: 14)
+            
+        Returns:
+            New (avg_gain, avg_loss); use rsi_from_averages() for the RSI
+        """
+        delta = price - prev_price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        
+        return avg_gain, avg_loss
     
     @staticmethod
     def is_bullish_crossover(fast_ema: float, slow_ema: float, 
@@ -147,6 +429,50 @@ class TechnicalIndicators:
         """
         return prev_fast_ema >= prev_slow_ema and fast_ema < slow_ema
     
+    @staticmethod
+    def crossovers(fast: PriceArray, slow: PriceArray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find every bullish and bearish crossover between two series (backtesting)
+        
+        Uses the same rule as is_bullish_crossover / is_bearish_crossover, so a
+        touch (fast == slow) only counts once the lines actually separate.
+        Bars where either series is NaN never produce an event.
+        
+        Args:
+            fast: Fast EMA series
+            slow: Slow EMA series (same length as fast)
+            
+        Returns:
+            (bull_idx, bear_idx) arrays of indices where the crossover happened
+        """
+        d = _as_array(fast) - _as_array(slow)
+        
+        above = d > 0
+        below = d < 0
+        valid = ~np.isnan(d)
+        valid = valid[:-1] & valid[1:]
+        
+        bull = np.flatnonzero(valid & ~above[:-1] & above[1:]) + 1
+        bear = np.flatnonzero(valid & ~below[:-1] & below[1:]) + 1
+        
+        return bull, bear
+    
+    @staticmethod
+    def rsi_zone(rsi: float, oversold: float = 30, overbought: float = 70) -> int:
+        """
+        Classify RSI in a single call
+        
+        Args:
+            rsi: Current RSI value
+            oversold: Oversold threshold (default: 30)
+            overbought: Overbought threshold (default: 70)
+            
+        Returns:
+            -1 if oversold, 1 if overbought, 0 otherwise
+        """
+        # int() because NumPy scalars compare to np.bool_, which cannot subtract
+        return int(rsi > overbought) - int(rsi < oversold)
+    
     @staticmethod
     def is_rsi_oversold(rsi: float, threshold: float = 30) -> bool:
         """
@@ -0,0 +1,188 @@
+"""
+Numba Indicator Kernels
+JIT-compiled EMA/RSI recurrences used by TechnicalIndicators when numba is installed
+"""
+import numpy as np
+
+from _njit import NUMBA_AVAILABLE, njit, prange
+
+if NUMBA_AVAILABLE:
+    from numba import float64, types
+
+    # Eager signature for the specialized EMA kernels. A read-only 1-D array
+    # in any layout also accepts writable ones, so np.frombuffer and pandas
+    # Copy-on-Write arrays work without a copy
+    _EMA_SIGNATURE = float64(types.Array(float64, 1, 'A', readonly=True))
+else:
+    _EMA_SIGNATURE = None
+
+
+@njit(cache=True, fastmath=True)
+def ema_last_nb(arr: np.ndarray, period: int) -> float:
+    """
+    Final EMA value of a float64 price array (SMA-seeded)
+
+    Caller guarantees len(arr) >= period.
+    """
+    multiplier = 2.0 / (period + 1)
+    one_minus = 1.0 - multiplier
+
+    ema = 0.0
+    for i in range(period):
+        ema += arr[i]
+    ema /= period
+
+    for i in range(period, arr.shape[0]):
+        ema = arr[i] * multiplier + ema * one_minus
+
+    return ema
+
+
+@njit(cache=True, fastmath=True)
+def ema_series_nb(arr: np.ndarray, period: int) -> np.ndarray:
+    """
+    EMA series of a float64 price array (SMA-seeded, NaN before the seed)
+
+    Caller guarantees len(arr) >= period.
+    """
+    multiplier = 2.0 / (period + 1)
+    one_minus = 1.0 - multiplier
+
+    out = np.empty(arr.shape[0])
+    ema = 0.0
+    for i in range(period):
+        ema += arr[i]
+        out[i] = np.nan
+    ema /= period
+    out[period - 1] = ema
+
+    for i in range(period, arr.shape[0]):
+        ema = arr[i] * multiplier + ema * one_minus
+        out[i] = ema
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def rsi_last_nb(arr: np.ndarray, period: int) -> float:
+    """
+    Final Wilder RSI value of a float64 price array
+
+    Caller guarantees len(arr) >= period + 1.
+    """
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = arr[i] - arr[i - 1]
+        avg_gain += max(delta, 0.0)
+        avg_loss += max(-delta, 0.0)
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period + 1, arr.shape[0]):
+        delta = arr[i] - arr[i - 1]
+        avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+
+    if avg_loss == 0:
+        return 100.0
+
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(cache=True, fastmath=True)
+def indicators_last_nb(arr: np.ndarray, ema_periods: np.ndarray, rsi_period: int):
+    """
+    Final EMAs and Wilder RSI averages of a float64 price array in one pass
+
+    Caller guarantees len(arr) >= max(ema_periods) and len(arr) >= rsi_period + 1.
+
+    Returns:
+        (emas, avg_gain, avg_loss), emas ordered like ema_periods
+    """
+    n_ema = ema_periods.shape[0]
+    emas = np.zeros(n_ema)
+    multipliers = np.empty(n_ema)
+    one_minus = np.empty(n_ema)
+    for j in range(n_ema):
+        multipliers[j] = 2.0 / (ema_periods[j] + 1)
+        one_minus[j] = 1.0 - multipliers[j]
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(arr.shape[0]):
+        price = arr[i]
+
+        for j in range(n_ema):
+            period = ema_periods[j]
+            if i < period:
+                emas[j] += price
+                if i == period - 1:
+                    emas[j] /= period
+            else:
+                emas[j] = price * multipliers[j] + emas[j] * one_minus[j]
+
+        if i == 0:
+            continue
+
+        delta = price - arr[i - 1]
+        if i <= rsi_period:
+            avg_gain += max(delta, 0.0)
+            avg_loss += max(-delta, 0.0)
+            if i == rsi_period:
+                avg_gain /= rsi_period
+                avg_loss /= rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + max(delta, 0.0)) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + max(-delta, 0.0)) / rsi_period
+
+    return emas, avg_gain, avg_loss
+
+
+# Not warmed up at import: compiling a parallel kernel starts numba's
+# threading layer, which only large update_ema_batch() calls need
+@njit(cache=True, fastmath=True, parallel=True)
+def update_all_ema_nb(states: np.ndarray, prices: np.ndarray, multipliers: np.ndarray) -> None:
+    """
+    Advance many independent EMAs by one price each, in place
+
+    Each slot is independent (e.g. one per bot), so slots run across cores.
+    """
+    for i in prange(states.shape[0]):
+        states[i] = prices[i] * multipliers[i] + states[i] * (1.0 - multipliers[i])
+
+
+def _make_ema_nb(period: int):
+    """
+    Build an EMA kernel with period, multiplier and 1 - multiplier baked in
+    as compile-time constants, so LLVM can fold them into the recurrence
+    """
+    multiplier = 2.0 / (period + 1)
+    one_minus = 1.0 - multiplier
+
+    # Closures are not cacheable, so these compile eagerly
+    @njit(_EMA_SIGNATURE, fastmath=True)
+    def ema_nb(arr):
+        ema = 0.0
+        for i in range(period):
+            ema += arr[i]
+        ema /= period
+
+        for i in range(period, arr.shape[0]):
+            ema = arr[i] * multiplier + ema * one_minus
+
+        return ema
+
+    return ema_nb
+
+
+# Specialized kernels for the common periods; others use ema_last_nb
+EMA_SPECIAL_NB = {period: _make_ema_nb(period) for period in (14, 20, 26, 50, 100, 200)}
+
+
+# Pay the compile cost at service start rather than on the first request
+ema_last_nb(np.zeros(32), 14)
+rsi_last_nb(np.zeros(32), 14)
+ema_series_nb(np.zeros(32), 14)
+indicators_last_nb(np.zeros(64), np.array([20, 50]), 14)
@@ -1,13 +1,20 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import anyio.to_thread
+import asyncio
 import uvicorn
 import logging
 import time
 
 from config import settings
 from bot_manager import BotManager
+from binance_client import client_pool, close_http_session
+from binance_websocket_api import ws_api_manager
 
 # Configure logging
 logging.basicConfig(
@@ -16,11 +23,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    # One shared executor per worker process, sized for I/O-bound bot fleets
+    # (asyncio's default is only min(32, cpu_count + 4) threads)
+    executor = ThreadPoolExecutor(
+        max_workers=settings.thread_pool_size,
+        thread_name_prefix='binance'
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    
+    # Bound Starlette's run_in_threadpool (sync endpoints/dependencies) to
+    # the same size
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+    
+    yield
+    
+    await client_pool.close_all()
+    await ws_api_manager.close_all()
+    await close_http_session()
+    executor.shutdown(wait=False)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="VATrade Bot Engine",
     description="Automated trading bot engine for cryptocurrency trading",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -63,6 +96,16 @@ class BotResponse(BaseModel):
     data: Optional[Dict] = None
 
 
+def bot_response(message: str, data=None) -> ORJSONResponse:
+    """
+    Build a successful BotResponse envelope
+    
+    Returned as a ready-made response, so FastAPI skips pydantic validation
+    and serializes straight to orjson (response_model stays for the docs)
+    """
+    return ORJSONResponse({"success": True, "message": message, "data": data})
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -102,8 +145,7 @@ async def start_bot(request: BotStartRequest):
             trade_amount=request.trade_amount or settings.default_trade_amount
         )
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message=f"Bot started successfully",
             data={"bot_id": bot_id, "status": "running"}
         )
@@ -131,8 +173,7 @@ async def stop_bot(request: BotStopRequest):
         if not success:
             raise HTTPException(status_code=404, detail="Bot not found or already stopped")
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Bot stopped successfully",
             data={"bot_id": request.bot_id, "status": "stopped"}
         )
@@ -160,8 +201,7 @@ async def get_bot_status(request: BotStatusRequest):
         else:
             data = await bot_manager.get_all_user_bots(request.user_id)
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Status retrieved successfully",
             data=data
         )
@@ -205,24 +245,18 @@ async def get_binance_account(request: BinanceAccountRequest):
     try:
         logger.info(f"Fetching Binance account for user {request.user_id}")
         
-        # Initialize temporary Binance client
-        from binance_client import BinanceClient
-        client = BinanceClient(
-            request.user_id, 
+        # Reuse pooled Binance client
+        client = await client_pool.get_client(
+            request.user_id,
             request.credential_id,
             request.api_key,
             request.secret_key
         )
-        await client.initialize()
         
         # Get account info
         account_info = await client.get_account_info()
         
-        # Cleanup
-        await client.close()
-        
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Account data retrieved successfully",
             data=account_info
         )
@@ -240,22 +274,17 @@ async def get_binance_balance(request: BinanceAccountRequest):
     try:
         logger.info(f"Fetching Binance balance for user {request.user_id}")
         
-        from binance_client import BinanceClient
-        client = BinanceClient(
+        client = await client_pool.get_client(
             request.user_id,
             request.credential_id,
             request.api_key,
             request.secret_key
         )
-        await client.initialize()
         
         # Get balances
         balances = await client.get_account_balance()
         
-        await client.close()
-        
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Balance retrieved successfully",
             data={"balances": balances}
         )
@@ -271,21 +300,16 @@ async def get_binance_ticker(request: BinanceAccountRequest, symbol: str = "BTCU
     Get current price for a symbol
     """
     try:
-        from binance_client import BinanceClient
-        client = BinanceClient(
+        client = await client_pool.get_client(
             request.user_id,
             request.credential_id,
             request.api_key,
             request.secret_key
         )
-        await client.initialize()
         
         ticker = await client.get_ticker(symbol)
         
-        await client.close()
-        
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Ticker retrieved successfully",
             data=ticker
         )
@@ -302,8 +326,6 @@ async def get_binance_account_ws(request: BinanceAccountRequest):
     Get account information via WebSocket API (real-time balance)
     """
     try:
-        from binance_websocket_api import ws_api_manager
-        
         client = await ws_api_manager.get_client(
             user_id=request.user_id,
             credential_id=request.credential_id,
@@ -330,8 +352,7 @@ async def get_binance_account_ws(request: BinanceAccountRequest):
                     'total': total
                 }
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Account data retrieved via WebSocket",
             data={
                 'balances': balances,
@@ -358,8 +379,6 @@ async def get_binance_orders_ws(
     Get order history via WebSocket API
     """
     try:
-        from binance_websocket_api import ws_api_manager
-        
         client = await ws_api_manager.get_client(
             user_id=request.user_id,
             credential_id=request.credential_id,
@@ -379,8 +398,7 @@ async def get_binance_orders_ws(
             limit=limit
         )
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Orders retrieved via WebSocket",
             data={'orders': orders}
         )
@@ -400,9 +418,6 @@ async def get_binance_trades_ws(
     Get trade history via WebSocket API
     """
     try:
-        from binance_websocket_api import ws_api_manager
-        import time
-        
         client = await ws_api_manager.get_client(
             user_id=request.user_id,
             credential_id=request.credential_id,
@@ -422,8 +437,7 @@ async def get_binance_trades_ws(
             limit=limit
         )
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Trades retrieved via WebSocket",
             data={'trades': trades}
         )
@@ -442,8 +456,6 @@ async def get_binance_open_orders_ws(
     Get current open orders via WebSocket API
     """
     try:
-        from binance_websocket_api import ws_api_manager
-        
         client = await ws_api_manager.get_client(
             user_id=request.user_id,
             credential_id=request.credential_id,
@@ -454,8 +466,7 @@ async def get_binance_open_orders_ws(
         
         open_orders = await client.get_open_orders(symbol=symbol)
         
-        return BotResponse(
-            success=True,
+        return bot_response(
             message="Open orders retrieved via WebSocket",
             data={'orders': open_orders}
         )
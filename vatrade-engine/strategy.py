@@ -1,19 +1,41 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Dict, Optional, List
 import logging
+import numpy as np
 from indicators import TechnicalIndicators
+from ticker_cache import interval_seconds
 
 logger = logging.getLogger(__name__)
 
+# Kline row layout: [open_time, open, high, low, close, volume, ...]
+_close = itemgetter(4)
+
+# Once incremental state is warm, fetch only the candle it was advanced to,
+# one newly closed candle and the forming candle
+INCREMENTAL_KLINES = 3
+
 
 class BaseStrategy(ABC):
     """Base class for trading strategies"""
     
+    __slots__ = (
+        'client', 'symbol', 'trade_amount', 'interval',
+        'kline_interval', 'history_limit', '_last_open_time'
+    )
+    
     def __init__(self, client, symbol: str, trade_amount: float):
         self.client = client
         self.symbol = symbol
         self.trade_amount = trade_amount
         self.interval = 60  # Default check interval in seconds
+        
+        # Candle data
+        self.kline_interval = '15m'
+        self.history_limit = 100  # Candles needed to seed indicator state
+        self._last_open_time: Optional[int] = None  # Last closed candle in state
     
     @abstractmethod
     async def analyze(self) -> Optional[Dict]:
@@ -28,6 +50,79 @@ class BaseStrategy(ABC):
     def get_interval(self) -> int:
         """Get check interval in seconds"""
         return self.interval
+    
+    async def fetch_klines(self) -> list:
+        """
+        Fetch candlestick data for incremental indicator updates
+        
+        Fetches the full history_limit window to seed state, and afterwards
+        only the newest INCREMENTAL_KLINES candles. Falls back to the full
+        window when the state's last candle is no longer in the short one
+        (e.g. after a delayed tick).
+        """
+        if self._last_open_time is not None:
+            klines = await self.client.get_klines(
+                symbol=self.symbol,
+                interval=self.kline_interval,
+                limit=INCREMENTAL_KLINES
+            )
+            if self._closed_since(klines, self._last_open_time) is not None:
+                return klines
+        
+        return await self.client.get_klines(
+            symbol=self.symbol,
+            interval=self.kline_interval,
+            limit=self.history_limit
+        )
+    
+    @staticmethod
+    def _parse_closes(klines: list) -> np.ndarray:
+        """Parse kline close prices straight into a float64 array"""
+        return np.fromiter(map(float, map(_close, klines)), dtype=np.float64, count=len(klines))
+    
+    @staticmethod
+    def _closed_since(klines: list, open_time: Optional[int]) -> Optional[int]:
+        """
+        Index of the first closed candle after the one opened at open_time
+        
+        The last kline is the candle still forming. Returns None when
+        open_time is unknown or no longer inside the fetched window, in which
+        case incremental state must be reseeded.
+        """
+        if open_time is None:
+            return None
+        
+        for i in range(len(klines) - 2, -1, -1):
+            if klines[i][0] == open_time:
+                return i + 1
+        
+        return None
+
+
+class CPUHeavyStrategy(ABC):
+    """
+    Mixin for strategies whose indicator computation can run off the event loop
+    
+    BotManager splits analyze() of these strategies into fetch_market_data()
+    (I/O, on the event loop) and analyze_sync() (computation, in a worker
+    thread) whenever is_cpu_heavy() is True.
+    """
+    
+    __slots__ = ()
+    
+    def is_cpu_heavy(self) -> bool:
+        """Whether the next analysis should run off the event loop"""
+        return True
+    
+    @abstractmethod
+    async def fetch_market_data(self):
+        """Fetch the market data consumed by analyze_sync()"""
+        pass
+    
+    @abstractmethod
+    def analyze_sync(self, market_data) -> Optional[Dict]:
+        """Synchronous analysis of data returned by fetch_market_data()"""
+        pass
 
 
 class SimpleMovingAverageStrategy(BaseStrategy):
@@ -38,6 +133,14 @@ class SimpleMovingAverageStrategy(BaseStrategy):
     Sell signal: Short-term SMA crosses below long-term SMA
     """
     
+    __slots__ = (
+        'short_period', 'long_period', 'last_short_sma', 'last_long_sma', 'position',
+        '_closed_closes', '_short_sum', '_long_sum'
+    )
+    
+    # Signal reason template, formatted only when a signal fires
+    _CROSSOVER_REASON = 'SMA crossover (short=%.2f, long=%.2f)'
+    
     def __init__(self, client, symbol: str, trade_amount: float,
                  short_period: int = 7, long_period: int = 25):
         super().__init__(client, symbol, trade_amount)
@@ -47,25 +150,53 @@ class SimpleMovingAverageStrategy(BaseStrategy):
         self.last_long_sma = None
         self.position = None  # None, 'long', 'short'
         self.interval = 300  # Check every 5 minutes
+        self.history_limit = long_period + 10
+        
+        # Rolling sums over closed candles; the forming candle is added per tick
+        self._closed_closes: deque = deque(maxlen=long_period - 1)
+        self._short_sum = 0.0
+        self._long_sum = 0.0
+    
+    def _advance_sums(self, klines: list):
+        """Bring the closed-candle window sums up to the last closed candle"""
+        last_closed_time = klines[-2][0]
+        if last_closed_time == self._last_open_time:
+            return
+        
+        short_window = self.short_period - 1
+        start = self._closed_since(klines, self._last_open_time)
+        
+        if start is None:
+            closed = list(map(float, map(_close, klines[-self.long_period:-1])))
+            self._closed_closes.clear()
+            self._closed_closes.extend(closed)
+            self._long_sum = sum(closed)
+            self._short_sum = sum(closed[-short_window:]) if short_window else 0.0
+        else:
+            window = self._closed_closes
+            for k in klines[start:-1]:
+                close = float(k[4])
+                if short_window:
+                    self._short_sum += close - window[-short_window]
+                if len(window) == window.maxlen:
+                    self._long_sum -= window[0]
+                self._long_sum += close
+                window.append(close)
+        
+        self._last_open_time = last_closed_time
     
     async def analyze(self) -> Optional[Dict]:
         """Analyze using SMA crossover"""
         try:
             # Get candlestick data (15-minute candles)
-            klines = await self.client.get_klines(
-                symbol=self.symbol,
-                interval='15m',
-                limit=self.long_period + 10
-            )
-            
-            # Extract closing prices
-            closes = [float(k[4]) for k in klines]  # Index 4 is close price
+            klines = await self.fetch_klines()
             
-            # Calculate SMAs
-            short_sma = sum(closes[-self.short_period:]) / self.short_period
-            long_sma = sum(closes[-self.long_period:]) / self.long_period
+            # Calculate SMAs: O(1) rolling sums plus the forming candle
+            self._advance_sums(klines)
+            current_price = float(klines[-1][4])  # Index 4 is close price
             
-            current_price = closes[-1]
+            short_sma = (self._short_sum + current_price) / self.short_period
+            long_sma = (self._long_sum + current_price) / self.long_period
             
             signal = None
             
@@ -76,12 +207,12 @@ class SimpleMovingAverageStrategy(BaseStrategy):
                     short_sma > long_sma and 
                     self.position != 'long'):
                     
-                    logger.info(f"BUY signal for {self.symbol}: SMA crossover detected")
+                    logger.info("BUY signal for %s: SMA crossover detected", self.symbol)
                     signal = {
                         'type': 'buy',
                         'price': current_price,
                         'amount': self.trade_amount,
-                        'reason': f'SMA crossover (short={short_sma:.2f}, long={long_sma:.2f})'
+                        'reason': self._CROSSOVER_REASON % (short_sma, long_sma)
                     }
                     self.position = 'long'
                 
@@ -90,12 +221,12 @@ class SimpleMovingAverageStrategy(BaseStrategy):
                       short_sma < long_sma and 
                       self.position == 'long'):
                     
-                    logger.info(f"SELL signal for {self.symbol}: SMA crossover detected")
+                    logger.info("SELL signal for %s: SMA crossover detected", self.symbol)
                     signal = {
                         'type': 'sell',
                         'price': current_price,
                         'amount': self.trade_amount,
-                        'reason': f'SMA crossover (short={short_sma:.2f}, long={long_sma:.2f})'
+                        'reason': self._CROSSOVER_REASON % (short_sma, long_sma)
                     }
                     self.position = None
             
@@ -104,16 +235,16 @@ class SimpleMovingAverageStrategy(BaseStrategy):
             self.last_long_sma = long_sma
             
             # Log current state
-            logger.debug(
-                f"{self.symbol} - Price: {current_price:.2f}, "
-                f"Short SMA: {short_sma:.2f}, Long SMA: {long_sma:.2f}, "
-                f"Position: {self.position}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s - Price: %.2f, Short SMA: %.2f, Long SMA: %.2f, Position: %s",
+                    self.symbol, current_price, short_sma, long_sma, self.position
+                )
             
             return signal
             
         except Exception as e:
-            logger.error(f"Error in SMA strategy analysis: {str(e)}")
+            logger.error("Error in SMA strategy analysis: %s", e)
             return None
 
 
@@ -125,6 +256,15 @@ class RSIStrategy(BaseStrategy):
     Sell signal: RSI > 70 (overbought)
     """
     
+    __slots__ = (
+        'period', 'oversold', 'overbought', 'position',
+        '_avg_gain', '_avg_loss', '_prev_close'
+    )
+    
+    # Signal reason templates, formatted only when a signal fires
+    _OVERSOLD_REASON = 'RSI oversold (%.2f)'
+    _OVERBOUGHT_REASON = 'RSI overbought (%.2f)'
+    
     def __init__(self, client, symbol: str, trade_amount: float,
                  period: int = 14, oversold: float = 30, overbought: float = 70):
         super().__init__(client, symbol, trade_amount)
@@ -133,76 +273,99 @@ class RSIStrategy(BaseStrategy):
         self.overbought = overbought
         self.position = None
         self.interval = 300  # Check every 5 minutes
-    
-    def calculate_rsi(self, prices: list) -> float:
-        """Calculate RSI indicator"""
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
         
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
+        self.history_limit = period + 20
         
-        avg_gain = sum(gains[-self.period:]) / self.period
-        avg_loss = sum(losses[-self.period:]) / self.period
+        # Wilder averages through the last closed candle
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._prev_close = 0.0
+    
+    def calculate_rsi(self, prices: list) -> float:
+        """Calculate RSI indicator (Wilder smoothing)"""
+        return TechnicalIndicators.calculate_rsi(prices, self.period)
+    
+    def _advance_averages(self, klines: list):
+        """Bring the Wilder averages up to the last closed candle"""
+        last_closed_time = klines[-2][0]
+        if last_closed_time == self._last_open_time:
+            return
         
-        if avg_loss == 0:
-            return 100
+        start = self._closed_since(klines, self._last_open_time)
         
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        if start is None:
+            closed = self._parse_closes(klines[:-1])
+            self._avg_gain, self._avg_loss = TechnicalIndicators.calculate_rsi_averages(
+                closed, self.period
+            )
+            self._prev_close = float(closed[-1])
+        else:
+            for k in klines[start:-1]:
+                close = float(k[4])
+                self._avg_gain, self._avg_loss = TechnicalIndicators.update_rsi(
+                    self._avg_gain, self._avg_loss, self._prev_close, close, self.period
+                )
+                self._prev_close = close
         
-        return rsi
+        self._last_open_time = last_closed_time
     
     async def analyze(self) -> Optional[Dict]:
         """Analyze using RSI"""
         try:
             # Get candlestick data
-            klines = await self.client.get_klines(
-                symbol=self.symbol,
-                interval='15m',
-                limit=self.period + 20
-            )
+            klines = await self.fetch_klines()
             
-            # Extract closing prices
-            closes = [float(k[4]) for k in klines]
-            current_price = closes[-1]
+            if self._last_open_time is None and len(klines) < self.period + 2:
+                logger.warning("Insufficient data for %s", self.symbol)
+                return None
             
-            # Calculate RSI
-            rsi = self.calculate_rsi(closes)
+            # Calculate RSI: O(1) Wilder update for the forming candle on
+            # top of the closed-candle averages
+            self._advance_averages(klines)
+            current_price = float(klines[-1][4])
+            
+            rsi = TechnicalIndicators.rsi_from_averages(
+                *TechnicalIndicators.update_rsi(
+                    self._avg_gain, self._avg_loss, self._prev_close, current_price, self.period
+                )
+            )
+            zone = TechnicalIndicators.rsi_zone(rsi, self.oversold, self.overbought)
             
             signal = None
             
             # Oversold - BUY signal
-            if rsi < self.oversold and self.position != 'long':
-                logger.info(f"BUY signal for {self.symbol}: RSI oversold ({rsi:.2f})")
+            if zone < 0 and self.position != 'long':
+                logger.info("BUY signal for %s: RSI oversold (%.2f)", self.symbol, rsi)
                 signal = {
                     'type': 'buy',
                     'price': current_price,
                     'amount': self.trade_amount,
-                    'reason': f'RSI oversold ({rsi:.2f})'
+                    'reason': self._OVERSOLD_REASON % rsi
                 }
                 self.position = 'long'
             
             # Overbought - SELL signal
-            elif rsi > self.overbought and self.position == 'long':
-                logger.info(f"SELL signal for {self.symbol}: RSI overbought ({rsi:.2f})")
+            elif zone > 0 and self.position == 'long':
+                logger.info("SELL signal for %s: RSI overbought (%.2f)", self.symbol, rsi)
                 signal = {
                     'type': 'sell',
                     'price': current_price,
                     'amount': self.trade_amount,
-                    'reason': f'RSI overbought ({rsi:.2f})'
+                    'reason': self._OVERBOUGHT_REASON % rsi
                 }
                 self.position = None
             
-            logger.debug(f"{self.symbol} - Price: {current_price:.2f}, RSI: {rsi:.2f}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s - Price: %.2f, RSI: %.2f", self.symbol, current_price, rsi)
             
             return signal
             
         except Exception as e:
-            logger.error(f"Error in RSI strategy analysis: {str(e)}")
+            logger.error("Error in RSI strategy analysis: %s", e)
             return None
 
 
-class EMA20EMA50RSIStrategy(BaseStrategy):
+class EMA20EMA50RSIStrategy(CPUHeavyStrategy, BaseStrategy):
     """
     Advanced EMA20/EMA50 with RSI Strategy
     
@@ -221,67 +384,101 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
     - Breakeven: Move SL to entry when profit >= 2%
     """
     
+    __slots__ = (
+        'position', 'last_buy_open_time', 'highest_price_since_entry',
+        'tp1_reached', '_interval_ms', '_indicator_state'
+    )
+    
+    # EMA smoothing constants, alpha = 2 / (period + 1)
+    ALPHA20 = 2.0 / 21
+    ONE_MINUS_ALPHA20 = 1.0 - ALPHA20
+    ALPHA50 = 2.0 / 51
+    ONE_MINUS_ALPHA50 = 1.0 - ALPHA50
+    
+    # Signal reason templates, formatted only when a signal fires
+    _BUY_REASON = (
+        'EMA20/50/RSI Strategy: Uptrend + Pullback + Breakout | '
+        'EMA20=%.2f, EMA50=%.2f, RSI=%.2f'
+    )
+    _STOP_LOSS_REASON = 'Stop Loss triggered at %.2f | Loss: %.2f%%'
+    _TP1_REASON = 'Take Profit 1 (50%% exit) | Profit: %.2f%%'
+    _TRAILING_STOP_REASON = 'Trailing Stop (2%%) | Final Profit: %.2f%%'
+    
     def __init__(self, client, symbol: str, trade_amount: float):
         super().__init__(client, symbol, trade_amount)
         self.interval = 300  # Check every 5 minutes
         
         # Position state
         self.position = None  # None or dict with entry details
-        self.last_buy_bar = -10  # Last candle index when bought
-        self.current_bar = 0  # Current candle index
+        self.last_buy_open_time: Optional[int] = None  # Open time (ms) of the candle bought in
         self.highest_price_since_entry = 0  # For trailing stop
         self.tp1_reached = False  # TP1 status
         
-    async def analyze(self) -> Optional[Dict]:
-        """Analyze market using EMA20/EMA50/RSI strategy"""
+        self._interval_ms = interval_seconds(self.kline_interval) * 1000
+        
+        # Streaming indicator state through the last closed candle:
+        # {'ema20', 'ema50', 'rsi14': (avg_gain, avg_loss, close)}
+        self._indicator_state: Optional[Dict] = None
+        
+    def is_cpu_heavy(self) -> bool:
+        """
+        Seeding EMA20/EMA50/RSI over the full history is worth offloading
+        from the event loop; once warm, each tick is an O(1) update that
+        costs less than the hop to a worker thread
+        """
+        return self._indicator_state is None
+    
+    async def fetch_market_data(self) -> Optional[list]:
+        """Fetch candlestick data for analysis"""
         try:
             # Get candlestick data (15-minute candles)
             # Need enough data for EMA50 calculation + history
-            klines = await self.client.get_klines(
-                symbol=self.symbol,
-                interval='15m',
-                limit=100
-            )
-            
-            if len(klines) < 60:
-                logger.warning(f"Insufficient data for {self.symbol}")
+            return await self.fetch_klines()
+        except Exception as e:
+            logger.error("Error in EMA20/EMA50/RSI strategy: %s", e)
+            return None
+    
+    async def analyze(self) -> Optional[Dict]:
+        """Analyze market using EMA20/EMA50/RSI strategy"""
+        klines = await self.fetch_market_data()
+        return self.analyze_sync(klines)
+    
+    def analyze_sync(self, klines: Optional[list]) -> Optional[Dict]:
+        """Compute indicators and signals from candlestick data"""
+        if klines is None:
+            return None
+        
+        try:
+            if self._indicator_state is None and len(klines) < 60:
+                logger.warning("Insufficient data for %s", self.symbol)
                 return None
             
-            # Extract OHLC data
-            closes = [float(k[4]) for k in klines]  # Close prices
-            lows = [float(k[3]) for k in klines]    # Low prices
-            highs = [float(k[2]) for k in klines]   # High prices
-            
-            # Calculate indicators
-            ema20_series = TechnicalIndicators.calculate_ema_series(closes, 20)
-            ema50_series = TechnicalIndicators.calculate_ema_series(closes, 50)
-            rsi = TechnicalIndicators.calculate_rsi(closes, 14)
-            
-            # Current values
-            current_close = closes[-1]
-            current_low = lows[-1]
-            current_high = highs[-1]
-            ema20 = ema20_series[-1]
-            ema50 = ema50_series[-1]
+            # Advance indicators through the last closed candle
+            state = self._advance_indicators(klines)
+            
+            # Current values (the last candle is still forming, so its
+            # indicators are one O(1) update on top of the closed state)
+            current = klines[-1]
+            current_close = float(current[4])  # Close price
+            current_low = float(current[3])    # Low price
+            current_high = float(current[2])   # High price
+            ema20 = current_close * self.ALPHA20 + state['ema20'] * self.ONE_MINUS_ALPHA20
+            ema50 = current_close * self.ALPHA50 + state['ema50'] * self.ONE_MINUS_ALPHA50
+            avg_gain, avg_loss, prev_close = state['rsi14']
+            rsi = TechnicalIndicators.rsi_from_averages(
+                *TechnicalIndicators.update_rsi(avg_gain, avg_loss, prev_close, current_close, 14)
+            )
             
             # Previous values
-            prev_low = lows[-2]
-            prev_ema20 = ema20_series[-2]
-            prev_ema50 = ema50_series[-2]
-            
-            # Increment bar counter
-            self.current_bar += 1
-            
-            # Check if we have valid indicators
-            if ema20 is None or ema50 is None or rsi is None:
-                logger.warning(f"Indicators not ready for {self.symbol}")
-                return None
+            prev_low = float(klines[-2][3])
+            prev_ema20 = state['ema20']
+            prev_ema50 = state['ema50']
             
             signal = None
             
             # === POSITION MANAGEMENT (if we have open position) ===
             if self.position:
-                signal = await self._check_exit_conditions(
+                signal = self._check_exit_conditions(
                     current_close, current_low, current_high, ema20
                 )
                 if signal:
@@ -293,26 +490,73 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
             if not self.position:
                 signal = self._check_entry_conditions(
                     current_close, current_low, ema20, ema50, 
-                    prev_low, prev_ema20, prev_ema50, rsi
+                    prev_low, prev_ema20, prev_ema50, rsi, current[0]
                 )
             
             # Log current state
-            logger.debug(
-                f"{self.symbol} - Price: {current_close:.2f}, "
-                f"EMA20: {ema20:.2f}, EMA50: {ema50:.2f}, RSI: {rsi:.2f}, "
-                f"Position: {'OPEN' if self.position else 'NONE'}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s - Price: %.2f, EMA20: %.2f, EMA50: %.2f, RSI: %.2f, Position: %s",
+                    self.symbol, current_close, ema20, ema50, rsi,
+                    'OPEN' if self.position else 'NONE'
+                )
             
             return signal
             
         except Exception as e:
-            logger.error(f"Error in EMA20/EMA50/RSI strategy: {str(e)}")
+            logger.error("Error in EMA20/EMA50/RSI strategy: %s", e)
             return None
     
+    def _advance_indicators(self, klines: list) -> Dict:
+        """
+        Bring EMA20/EMA50/RSI14 state up to the last closed candle
+        
+        Seeds from the batch calculators on first use (or after a gap longer
+        than the fetched window), then applies one streaming update per
+        newly closed candle.
+        """
+        last_closed_time = klines[-2][0]
+        state = self._indicator_state
+        
+        if state is not None and self._last_open_time == last_closed_time:
+            return state
+        
+        # Continue after the candle the state was last advanced to
+        start = self._closed_since(klines, self._last_open_time) if state else None
+        
+        if start is None:
+            closed = self._parse_closes(klines[:-1])
+            (ema20, ema50), avg_gain, avg_loss = TechnicalIndicators.compute_indicators(
+                closed, (20, 50), 14
+            )
+            self._last_open_time = last_closed_time
+            self._indicator_state = {
+                'ema20': ema20,
+                'ema50': ema50,
+                'rsi14': (avg_gain, avg_loss, float(closed[-1]))
+            }
+            return self._indicator_state
+        
+        ema20, ema50 = state['ema20'], state['ema50']
+        avg_gain, avg_loss, prev_close = state['rsi14']
+        
+        for k in klines[start:-1]:
+            close = float(k[4])
+            ema20 = close * self.ALPHA20 + ema20 * self.ONE_MINUS_ALPHA20
+            ema50 = close * self.ALPHA50 + ema50 * self.ONE_MINUS_ALPHA50
+            avg_gain, avg_loss = TechnicalIndicators.update_rsi(
+                avg_gain, avg_loss, prev_close, close, 14
+            )
+            prev_close = close
+        
+        self._last_open_time = last_closed_time
+        state.update(ema20=ema20, ema50=ema50, rsi14=(avg_gain, avg_loss, prev_close))
+        return state
+    
     def _check_entry_conditions(self, current_close: float, current_low: float,
                                 ema20: float, ema50: float, prev_low: float,
                                 prev_ema20: float, prev_ema50: float, 
-                                rsi: float) -> Optional[Dict]:
+                                rsi: float, open_time: int) -> Optional[Dict]:
         """Check all entry conditions for BUY signal"""
         
         # IMPORTANT: Only buy if NO position is open
@@ -320,78 +564,74 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
         if self.position is not None:
             return None
         
+        # Cheapest and most selective checks first, so a rejected tick exits early
+        
+        # F. Cooldown (2 candles since last buy), by candle open time so it
+        # does not depend on how often analyze() runs per candle
+        cooldown_bars = 2
+        if (self.last_buy_open_time is not None and
+                open_time - self.last_buy_open_time <= cooldown_bars * self._interval_ms):
+            return None
+        
+        # E. RSI momentum (RSI > 50)
+        if rsi <= 50:
+            return None
+        
         # A. Trend Filter (Uptrend)
-        trend_up = current_close > ema50 and ema50 > prev_ema50
+        if not (current_close > ema50 > prev_ema50):
+            return None
         
         # B. Pullback occurred (previous candle touched EMA20)
-        pullback_prev = prev_low <= prev_ema20
-        
-        # C. Breakout (current close above EMA20)
-        break_up_now = current_close > ema20
+        if prev_low > prev_ema20:
+            return None
         
+        # C. Breakout (current close above EMA20) and
         # D. Not too high (within 6% of EMA20)
-        not_too_high = current_close < ema20 * 1.06
+        if not (ema20 < current_close < ema20 * 1.06):
+            return None
         
-        # E. RSI momentum (RSI > 50)
-        rsi_ok = rsi > 50
+        # All conditions met: BUY
+        # Calculate stop loss (0.3% below previous low)
+        stop_loss = prev_low * 0.997
         
-        # F. Cooldown (2 candles since last buy)
-        cooldown_bars = 2
-        can_buy = (self.current_bar - self.last_buy_bar) > cooldown_bars
+        # Calculate risk
+        risk = current_close - stop_loss
+        
+        # Calculate TP1 (Risk:Reward 1:2)
+        take_profit_1 = current_close + (risk * 2)
         
-        # Check if ALL conditions are met
-        buy_signal = (
-            trend_up and pullback_prev and break_up_now and 
-            not_too_high and rsi_ok and can_buy
+        logger.info(
+            "🟢 BUY SIGNAL for %s at %.2f | EMA20=%.2f, EMA50=%.2f, RSI=%.2f | "
+            "SL=%.2f, TP1=%.2f",
+            self.symbol, current_close, ema20, ema50, rsi, stop_loss, take_profit_1
         )
         
-        if buy_signal:
-            # Calculate stop loss (0.3% below previous low)
-            stop_loss = prev_low * 0.997
-            
-            # Calculate risk
-            risk = current_close - stop_loss
-            
-            # Calculate TP1 (Risk:Reward 1:2)
-            take_profit_1 = current_close + (risk * 2)
-            
-            logger.info(
-                f"🟢 BUY SIGNAL for {self.symbol} at {current_close:.2f} | "
-                f"EMA20={ema20:.2f}, EMA50={ema50:.2f}, RSI={rsi:.2f} | "
-                f"SL={stop_loss:.2f}, TP1={take_profit_1:.2f}"
-            )
-            
-            # Update position state
-            self.position = {
-                'entry_price': current_close,
-                'stop_loss': stop_loss,
-                'take_profit_1': take_profit_1,
-                'initial_amount': self.trade_amount,
-                'remaining_amount': self.trade_amount,
-                'risk': risk,
-                'pullback_low': prev_low
-            }
-            self.last_buy_bar = self.current_bar
-            self.highest_price_since_entry = current_close
-            self.tp1_reached = False
-            
-            return {
-                'type': 'buy',
-                'price': current_close,
-                'amount': self.trade_amount,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit_1,
-                'reason': (
-                    f'EMA20/50/RSI Strategy: Uptrend + Pullback + Breakout | '
-                    f'EMA20={ema20:.2f}, EMA50={ema50:.2f}, RSI={rsi:.2f}'
-                )
-            }
+        # Update position state
+        self.position = {
+            'entry_price': current_close,
+            'stop_loss': stop_loss,
+            'take_profit_1': take_profit_1,
+            'initial_amount': self.trade_amount,
+            'remaining_amount': self.trade_amount,
+            'risk': risk,
+            'pullback_low': prev_low
+        }
+        self.last_buy_open_time = open_time
+        self.highest_price_since_entry = current_close
+        self.tp1_reached = False
         
-        return None
+        return {
+            'type': 'buy',
+            'price': current_close,
+            'amount': self.trade_amount,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit_1,
+            'reason': self._BUY_REASON % (ema20, ema50, rsi)
+        }
     
-    async def _check_exit_conditions(self, current_close: float, 
-                                     current_low: float, current_high: float,
-                                     ema20: float) -> Optional[Dict]:
+    def _check_exit_conditions(self, current_close: float, 
+                               current_low: float, current_high: float,
+                               ema20: float) -> Optional[Dict]:
         """Check exit conditions: Stop Loss, TP1, Trailing Stop, Breakeven"""
         
         if not self.position:
@@ -414,15 +654,15 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
             self.position['stop_loss'] = entry_price
             stop_loss = entry_price
             logger.info(
-                f"📊 BREAKEVEN activated for {self.symbol} | "
-                f"SL moved to entry: {entry_price:.2f}"
+                "📊 BREAKEVEN activated for %s | SL moved to entry: %.2f",
+                self.symbol, entry_price
             )
         
         # === 2. STOP LOSS (Cut Loss) ===
         if current_low <= stop_loss:
             logger.info(
-                f"🔴 STOP LOSS hit for {self.symbol} at {current_close:.2f} | "
-                f"Entry: {entry_price:.2f}, Loss: {profit_pct:.2f}%"
+                "🔴 STOP LOSS hit for %s at %.2f | Entry: %.2f, Loss: %.2f%%",
+                self.symbol, current_close, entry_price, profit_pct
             )
             
             # Close entire position
@@ -430,7 +670,7 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
                 'type': 'sell',
                 'price': current_close,
                 'amount': remaining_amount,
-                'reason': f'Stop Loss triggered at {stop_loss:.2f} | Loss: {profit_pct:.2f}%'
+                'reason': self._STOP_LOSS_REASON % (stop_loss, profit_pct)
             }
             
             # Reset position
@@ -449,15 +689,15 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
             self.position['remaining_amount'] = remaining_amount - partial_amount
             
             logger.info(
-                f"🟢 TAKE PROFIT 1 reached for {self.symbol} at {current_close:.2f} | "
-                f"Selling 50% position | Profit: {profit_pct:.2f}%"
+                "🟢 TAKE PROFIT 1 reached for %s at %.2f | Selling 50%% position | Profit: %.2f%%",
+                self.symbol, current_close, profit_pct
             )
             
             return {
                 'type': 'sell',
                 'price': current_close,
                 'amount': partial_amount,
-                'reason': f'Take Profit 1 (50% exit) | Profit: {profit_pct:.2f}%'
+                'reason': self._TP1_REASON % profit_pct
             }
         
         # === 4. TRAILING STOP (After TP1, track remaining 50%) ===
@@ -467,9 +707,8 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
             
             if current_low <= trailing_stop:
                 logger.info(
-                    f"🟡 TRAILING STOP hit for {self.symbol} at {current_close:.2f} | "
-                    f"Highest: {self.highest_price_since_entry:.2f}, "
-                    f"Final Profit: {profit_pct:.2f}%"
+                    "🟡 TRAILING STOP hit for %s at %.2f | Highest: %.2f, Final Profit: %.2f%%",
+                    self.symbol, current_close, self.highest_price_since_entry, profit_pct
                 )
                 
                 # Close remaining position
@@ -477,7 +716,7 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
                     'type': 'sell',
                     'price': current_close,
                     'amount': remaining_amount,
-                    'reason': f'Trailing Stop (2%) | Final Profit: {profit_pct:.2f}%'
+                    'reason': self._TRAILING_STOP_REASON % profit_pct
                 }
                 
                 # Reset position
@@ -493,18 +732,22 @@ class EMA20EMA50RSIStrategy(BaseStrategy):
 class StrategyFactory:
     """Factory for creating strategy instances"""
     
-    STRATEGIES = {
+    # Read-only registry keyed by lowercase name
+    STRATEGIES = MappingProxyType({
         'simple_moving_average': SimpleMovingAverageStrategy,
         'rsi': RSIStrategy,
         'ema20_ema50_rsi': EMA20EMA50RSIStrategy,
-    }
+    })
     
     @classmethod
     def create(cls, strategy_name: str, client, symbol: str, 
                trade_amount: float) -> BaseStrategy:
         """Create strategy instance by name"""
         
-        strategy_class = cls.STRATEGIES.get(strategy_name.lower())
+        # Names usually arrive lowercase already, so try them as-is first
+        strategy_class = (
+            cls.STRATEGIES.get(strategy_name) or cls.STRATEGIES.get(strategy_name.lower())
+        )
         
         if not strategy_class:
             raise ValueError(
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Engine modules are imported flat (e.g. `from indicators import ...`)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from indicators import TechnicalIndicators
+
+
+@pytest.mark.parametrize("rsi, zone", [(25.0, -1), (50.0, 0), (75.0, 1), (30.0, 0), (70.0, 0)])
+def test_rsi_zone(rsi, zone):
+    assert TechnicalIndicators.rsi_zone(rsi) == zone
+
+
+def test_rsi_zone_numpy_scalar():
+    assert TechnicalIndicators.rsi_zone(np.float64(25.0)) == -1
+    assert TechnicalIndicators.rsi_zone(np.float64(50.0)) == 0
+    assert TechnicalIndicators.rsi_zone(np.float64(75.0)) == 1
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def backend(request, monkeypatch):
+    """Run a test on the numba kernels (when installed) and on the NumPy fallback"""
+    import indicators
+    
+    if request.param == "numba":
+        if indicators.indicators_last_nb is None:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(indicators, "indicators_last_nb", None)
+        monkeypatch.setattr(indicators, "ema_last_nb", None)
+        monkeypatch.setattr(indicators, "update_all_ema_nb", None)
+    return request.param
+
+
+@pytest.mark.parametrize("size", [100, 5000])
+def test_update_ema_batch(backend, size):
+    rng = np.random.default_rng(3)
+    states = rng.normal(100, 5, size)
+    prices = rng.normal(100, 5, size)
+    multipliers = 2.0 / (rng.integers(2, 200, size) + 1)
+    expected = prices * multipliers + states * (1.0 - multipliers)
+    
+    result = TechnicalIndicators.update_ema_batch(states, prices, multipliers)
+    
+    assert result is states
+    assert states == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("size", [100, 5000])
+def test_update_ema_batch_scalar_inputs(backend, size):
+    states = np.ones(size)
+    TechnicalIndicators.update_ema_batch(states, 3.0, 0.5)
+    assert states == pytest.approx(np.full(size, 2.0))
+
+
+@pytest.mark.parametrize("size", [100, 5000])
+def test_update_ema_batch_rejects_bad_input(backend, size):
+    with pytest.raises(ValueError):
+        TechnicalIndicators.update_ema_batch(np.ones(size), np.full(10, 3.0), np.full(10, 0.5))
+    with pytest.raises(ValueError):
+        TechnicalIndicators.update_ema_batch(np.ones(size, dtype=np.int64), 3.0, 0.5)
+    with pytest.raises(ValueError):
+        TechnicalIndicators.update_ema_batch(np.ones((2, size)), 3.0, 0.5)
+    
+    readonly = np.ones(size)
+    readonly.flags.writeable = False
+    with pytest.raises(ValueError):
+        TechnicalIndicators.update_ema_batch(readonly, 3.0, 0.5)
+
+
+def _reference_ema(prices, period):
+    ema = sum(prices[:period]) / period
+    for price in prices[period:]:
+        ema += (price - ema) * 2 / (period + 1)
+    return ema
+
+
+def _reference_rsi_averages(prices, period):
+    deltas = [b - a for a, b in zip(prices, prices[1:])]
+    avg_gain = sum(max(d, 0) for d in deltas[:period]) / period
+    avg_loss = sum(max(-d, 0) for d in deltas[:period]) / period
+    for d in deltas[period:]:
+        avg_gain = (avg_gain * (period - 1) + max(d, 0)) / period
+        avg_loss = (avg_loss * (period - 1) + max(-d, 0)) / period
+    return avg_gain, avg_loss
+
+
+@pytest.mark.parametrize("ema_periods, rsi_period", [((5, 10), 14), ((20, 50), 14)])
+def test_compute_indicators_at_minimum_length(backend, ema_periods, rsi_period):
+    rng = np.random.default_rng(7)
+    n = max(max(ema_periods), rsi_period + 1)
+    prices = 100 + rng.normal(0, 1, n).cumsum()
+    
+    assert TechnicalIndicators.compute_indicators(prices[:-1], ema_periods, rsi_period) is None
+    
+    emas, avg_gain, avg_loss = TechnicalIndicators.compute_indicators(prices, ema_periods, rsi_period)
+    closes = prices.tolist()
+    assert emas == pytest.approx(tuple(_reference_ema(closes, period) for period in ema_periods))
+    assert (avg_gain, avg_loss) == pytest.approx(_reference_rsi_averages(closes, rsi_period))
@@ -0,0 +1,143 @@
+import asyncio
+import random
+
+import pytest
+
+from indicators import TechnicalIndicators
+from strategy import INCREMENTAL_KLINES, StrategyFactory
+
+CANDLE_MS = 900_000  # 15m
+
+
+def make_klines(n, seed):
+    """Synthetic 15m kline stream in the Binance REST row layout"""
+    rng = random.Random(seed)
+    t0 = 1_700_000_000_000
+    price = 100.0
+    klines = []
+    for i in range(n):
+        open_price = price
+        price = max(1.0, price * (1 + rng.gauss(0.0005, 0.012)))
+        high = max(open_price, price) * (1 + abs(rng.gauss(0, 0.004)))
+        low = min(open_price, price) * (1 - abs(rng.gauss(0, 0.004)))
+        klines.append([
+            t0 + i * CANDLE_MS, f"{open_price:.2f}", f"{high:.2f}", f"{low:.2f}",
+            f"{price:.2f}", "1", t0 + (i + 1) * CANDLE_MS - 1
+        ])
+    return klines
+
+
+class ReplayClient:
+    """Fake Binance client serving the newest candles of a kline stream up to `end`"""
+
+    def __init__(self, klines, end):
+        self.klines = klines
+        self.end = end  # klines[end - 1] is the candle still forming
+        self.jitter = 0.0  # Moves the forming candle's close between polls
+        self.limits = []
+        self.window = None
+
+    async def get_klines(self, symbol, interval, limit=100):
+        self.limits.append(limit)
+        window = [list(k) for k in self.klines[max(0, self.end - limit):self.end]]
+        window[-1][4] = f"{float(window[-1][4]) * (1 + self.jitter):.2f}"
+        self.window = window
+        return window
+
+
+def replay(strategy, client, seed, steps=400):
+    """
+    Poll the strategy like the bot loop would, yielding after each analyze()
+
+    Ticks repeat the same candle, move to the next one, skip a few (past the
+    incremental window) or jump past the whole history window.
+    """
+    rng = random.Random(seed)
+
+    async def tick():
+        return await strategy.analyze()
+
+    for _ in range(steps):
+        advance = rng.choice([0, 0, 1, 1, 1, 2, 5, 150])
+        if client.end + advance > len(client.klines):
+            break
+        client.end += advance
+        client.jitter = rng.gauss(0, 0.003)
+        client.limits = []
+        asyncio.run(tick())
+        yield advance
+
+
+def closes(klines):
+    return [float(k[4]) for k in klines]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_sma_rolling_sums_match_batch(seed):
+    stream = make_klines(2000, seed)
+    client = ReplayClient(stream, 200)
+    strategy = StrategyFactory.create('simple_moving_average', client, 'BTC/USDT', 1.0)
+
+    advances = set()
+    for advance in replay(strategy, client, seed):
+        advances.add(advance)
+        prices = closes(stream[:client.end - 1]) + [float(client.window[-1][4])]
+
+        assert strategy.last_short_sma == pytest.approx(
+            sum(prices[-strategy.short_period:]) / strategy.short_period, rel=1e-12
+        )
+        assert strategy.last_long_sma == pytest.approx(
+            sum(prices[-strategy.long_period:]) / strategy.long_period, rel=1e-12
+        )
+
+    assert advances == {0, 1, 2, 5, 150}
+
+
+def rsi_state(strategy, closed):
+    expected = TechnicalIndicators.calculate_rsi_averages(closed, strategy.period)
+    return (strategy._avg_gain, strategy._avg_loss, strategy._prev_close), expected + (closed[-1],)
+
+
+def ema20_ema50_rsi_state(strategy, closed):
+    state = strategy._indicator_state
+    expected = (
+        TechnicalIndicators.calculate_ema(closed, 20),
+        TechnicalIndicators.calculate_ema(closed, 50),
+        *TechnicalIndicators.calculate_rsi_averages(closed, 14),
+        closed[-1]
+    )
+    return (state['ema20'], state['ema50'], *state['rsi14']), expected
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("name, get_state", [
+    ('rsi', rsi_state),
+    ('ema20_ema50_rsi', ema20_ema50_rsi_state),
+])
+def test_incremental_state_matches_batch(name, get_state, seed):
+    stream = make_klines(2000, seed)
+    client = ReplayClient(stream, 200)
+    strategy = StrategyFactory.create(name, client, 'BTC/USDT', 1.0)
+
+    seed_start = None  # Stream index the state was last seeded from
+    last_closed = None  # Open time of the last closed candle in the state
+
+    for advance in replay(strategy, client, seed):
+        window = client.window
+
+        # Warm state fetches only the short window, and the full one only
+        # when the state's last candle has dropped out of it
+        if last_closed is None:
+            assert client.limits == [strategy.history_limit]
+        elif advance <= 1:
+            assert client.limits == [INCREMENTAL_KLINES]
+        else:
+            assert client.limits == [INCREMENTAL_KLINES, strategy.history_limit]
+
+        # Candles the state no longer overlaps with are reseeded from the window
+        if last_closed not in [k[0] for k in window[:-1]]:
+            seed_start = client.end - len(window)
+        last_closed = window[-2][0]
+
+        actual, expected = get_state(strategy, closes(stream[seed_start:client.end - 1]))
+        assert actual == pytest.approx(expected, rel=1e-12)
@@ -0,0 +1,101 @@
+"""
+Ticker Cache Module
+Process-wide short-TTL cache and in-flight request coalescing for Binance
+REST responses shared by all bots
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, Union
+
+# key -> (expiry on the monotonic clock, value)
+_entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+# key -> in-flight fetch shared by every concurrent caller
+_inflight: Dict[Hashable, asyncio.Task] = {}
+
+# Expired entries are swept at most this often (seconds), on a cache miss
+PRUNE_INTERVAL = 60.0
+_next_prune = 0.0
+
+# Fixed TTL in seconds, or a function computing it from the fetched value
+TTL = Union[float, Callable[[Any], float]]
+
+# Seconds per kline interval unit (1m, 15m, 4h, 1d, 1w, 1M, ...)
+_INTERVAL_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'M': 2592000}
+
+
+def interval_seconds(interval: str) -> int:
+    """Convert a kline interval like '15m' to seconds"""
+    return int(interval[:-1]) * _INTERVAL_UNITS[interval[-1]]
+
+
+async def coalesce(key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Run coro_factory once for all concurrent callers with the same key
+
+    The first caller starts the fetch as a task; callers arriving while it is
+    in flight await the same task. The task is shielded, so a cancelled
+    caller never cancels the fetch for the others.
+
+    Args:
+        key: Request identity (method + params)
+        coro_factory: Zero-argument callable returning the fetch coroutine
+
+    Returns:
+        Result of the shared fetch
+    """
+    task = _inflight.get(key)
+
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _inflight.pop(key, None) if _inflight.get(key) is t else None)
+
+    return await asyncio.shield(task)
+
+
+def _prune(now: float):
+    """Drop expired entries, so keys for gone users and symbols do not pile up"""
+    global _next_prune
+    _next_prune = now + PRUNE_INTERVAL
+
+    expired = [key for key, (expires_at, _) in _entries.items() if expires_at <= now]
+    for key in expired:
+        del _entries[key]
+
+
+async def _fetch_and_store(key: Hashable, coro_factory: Callable[[], Awaitable[Any]],
+                           ttl: TTL) -> Any:
+    """Fetch a value and store it in the cache"""
+    value = await coro_factory()
+    if callable(ttl):
+        ttl = ttl(value)
+    if ttl > 0:
+        _entries[key] = (time.monotonic() + ttl, value)
+    return value
+
+
+async def cached(key: Hashable, coro_factory: Callable[[], Awaitable[Any]], ttl: TTL) -> Any:
+    """
+    Return the cached value for key, fetching it with coro_factory on a miss
+
+    Concurrent misses on the same key are coalesced into a single fetch.
+
+    Args:
+        key: Cache key (public data must not include user identifiers)
+        coro_factory: Zero-argument callable returning the fetch coroutine
+        ttl: Time to live in seconds, or a function of the fetched value
+            returning it (values with a TTL <= 0 are not cached)
+
+    Returns:
+        Cached or freshly fetched value
+    """
+    now = time.monotonic()
+    entry = _entries.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    if now >= _next_prune:
+        _prune(now)
+
+    return await coalesce(key, lambda: _fetch_and_store(key, coro_factory, ttl))